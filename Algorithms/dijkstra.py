@@ -9,10 +9,20 @@ Time Complexity: O((V + E) log V) with priority queue, O(V²) with array
 Space Complexity: O(V)
 
 Note: Does not work with negative edge weights. Use Bellman-Ford for that.
+
+dijkstra() pushes a new queue entry on every improvement and skips stale
+ones, so the queue can grow to O(E). dijkstra_indexed() instead keeps one
+entry per vertex in an IndexedMinHeap and lowers its key in place, so the
+queue never holds more than V entries.
 """
 
 
 import heapq
+import os
+import random
+import sys
+import time
+import tracemalloc
 
 
 def dijkstra(graph, start):
@@ -59,6 +69,47 @@ def dijkstra(graph, start):
     return distances
 
 
+def dijkstra_indexed(graph, start):
+    """
+    Dijkstra's algorithm using decrease-key on an indexed priority queue.
+    
+    Args:
+        graph: Dictionary representing weighted graph {node: [(neighbor, weight), ...]}
+        start: Starting vertex
+    
+    Returns:
+        Dictionary of shortest distances {vertex: distance}
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                        "Data Structures")
+    if path not in sys.path:
+        sys.path.append(path)
+    from heap import IndexedMinHeap
+    
+    distances = {vertex: float('infinity') for vertex in graph}
+    distances[start] = 0
+    
+    # One entry per vertex, keyed by its tentative distance
+    pq = IndexedMinHeap()
+    pq.push(start, 0)
+    visited = set()
+    
+    while pq:
+        current_vertex, current_dist = pq.pop()
+        visited.add(current_vertex)
+        
+        for neighbor, weight in graph.get(current_vertex, []):
+            if neighbor in visited:
+                continue
+            
+            distance = current_dist + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                pq.push_or_decrease(neighbor, distance)
+    
+    return distances
+
+
 def dijkstra_path(graph, start, end):
     """
     Finds shortest path from start to end vertex.
@@ -115,6 +166,39 @@ def dijkstra_path(graph, start, end):
     return distances[end], path
 
 
+def benchmark(num_vertices=400, seed=0):
+    """
+    Compare dijkstra and dijkstra_indexed on a dense (complete) graph.
+    
+    Peak memory is what tracemalloc sees during a run, which is dominated
+    by the priority queue.
+    
+    Args:
+        num_vertices: Number of vertices; the graph has V * (V - 1) edges
+        seed: Random seed for the edge weights
+    """
+    rng = random.Random(seed)
+    graph = {u: [(v, rng.randint(1, 1000)) for v in range(num_vertices) if v != u]
+             for u in range(num_vertices)}
+    
+    print(f"  {num_vertices} vertices, {num_vertices * (num_vertices - 1):,} edges")
+    results = []
+    for name, function in (("heapq + duplicates", dijkstra),
+                           ("IndexedMinHeap", dijkstra_indexed)):
+        start = time.perf_counter()
+        results.append(function(graph, 0))
+        elapsed = time.perf_counter() - start
+        
+        tracemalloc.start()
+        function(graph, 0)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name:<20} {elapsed * 1000:>8.1f} ms, "
+              f"peak memory {peak / 1024:>8.1f} KB")
+    if results[0] != results[1]:
+        raise RuntimeError("dijkstra and dijkstra_indexed disagree")
+
+
 # Example usage
 if __name__ == "__main__":
     # Example weighted graph: {node: [(neighbor, weight), ...]}
@@ -135,4 +219,9 @@ if __name__ == "__main__":
     dist, path = dijkstra_path(graph, 'A', 'E')
     print(f"  Distance: {dist}")
     print(f"  Path: {' -> '.join(path)}")
-
+    
+    print("\nWith decrease-key (IndexedMinHeap):")
+    print(f"  {dijkstra_indexed(graph, 'A')}")
+    
+    print("\nBenchmark (dense graph):")
+    benchmark()
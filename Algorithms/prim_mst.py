@@ -9,10 +9,19 @@ Time Complexity: O(E log V) with binary heap, O(V²) with array
 Space Complexity: O(V)
 
 The MST connects all vertices with minimum total edge weight.
+
+prim_mst() keeps every candidate edge in the queue, up to O(E) entries.
+prim_mst_indexed() keeps one entry per vertex outside the tree, keyed by the
+cheapest known edge to it, and lowers that key in place (IndexedMinHeap).
 """
 
 
 import heapq
+import os
+import random
+import sys
+import time
+import tracemalloc
 
 
 def prim_mst(graph, start):
@@ -60,6 +69,80 @@ def prim_mst(graph, start):
     return mst_edges, total_weight
 
 
+def prim_mst_indexed(graph, start):
+    """
+    Prim's algorithm using decrease-key on an indexed priority queue.
+    
+    Args:
+        graph: Dictionary representing weighted graph {node: [(neighbor, weight), ...]}
+        start: Starting vertex
+    
+    Returns:
+        Tuple (mst_edges, total_weight) as for prim_mst
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                        "Data Structures")
+    if path not in sys.path:
+        sys.path.append(path)
+    from heap import IndexedMinHeap
+    
+    mst_edges = []
+    visited = set()
+    total_weight = 0
+    
+    # Vertex -> (tree vertex, weight) of its cheapest known connecting edge
+    parent = {}
+    pq = IndexedMinHeap()
+    pq.push(start, 0)
+    
+    while pq:
+        v, weight = pq.pop()
+        visited.add(v)
+        if v != start:
+            mst_edges.append((parent[v], v, weight))
+            total_weight += weight
+        
+        for neighbor, edge_weight in graph.get(v, []):
+            if neighbor not in visited and pq.push_or_decrease(neighbor, edge_weight):
+                parent[neighbor] = v
+    
+    return mst_edges, total_weight
+
+
+def benchmark(num_vertices=400, seed=0):
+    """
+    Compare prim_mst and prim_mst_indexed on a dense (complete) graph.
+    
+    Args:
+        num_vertices: Number of vertices; the graph has V * (V - 1) / 2 edges
+        seed: Random seed for the edge weights
+    """
+    rng = random.Random(seed)
+    graph = {u: [] for u in range(num_vertices)}
+    for u in range(num_vertices):
+        for v in range(u + 1, num_vertices):
+            weight = rng.randint(1, 1000)
+            graph[u].append((v, weight))
+            graph[v].append((u, weight))
+    
+    print(f"  {num_vertices} vertices, {num_vertices * (num_vertices - 1) // 2:,} edges")
+    totals = []
+    for name, function in (("heapq + duplicates", prim_mst),
+                           ("IndexedMinHeap", prim_mst_indexed)):
+        start = time.perf_counter()
+        totals.append(function(graph, 0)[1])
+        elapsed = time.perf_counter() - start
+        
+        tracemalloc.start()
+        function(graph, 0)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name:<20} {elapsed * 1000:>8.1f} ms, "
+              f"peak memory {peak / 1024:>8.1f} KB")
+    if totals[0] != totals[1]:
+        raise RuntimeError("prim_mst and prim_mst_indexed disagree")
+
+
 # Example usage
 if __name__ == "__main__":
     # Example weighted graph: {node: [(neighbor, weight), ...]}
@@ -78,4 +161,10 @@ if __name__ == "__main__":
     print("Edges in MST:")
     for u, v, weight in mst:
         print(f"  {u} -- {v} (weight: {weight})")
-
+    
+    print("\nWith decrease-key (IndexedMinHeap):")
+    mst, total_weight = prim_mst_indexed(graph, 'A')
+    print(f"  Total weight: {total_weight}, edges: {mst}")
+    
+    print("\nBenchmark (dense graph):")
+    benchmark()
@@ -0,0 +1,240 @@
+"""
+Aho-Corasick Multi-Pattern String Matching
+
+Aho-Corasick finds every occurrence of many patterns in one pass over the
+text. The patterns are inserted into a Trie; each trie node becomes a state,
+and breadth-first search adds two kinds of links:
+    - failure link: the state for the longest proper suffix of the current
+      match that is also a prefix of some pattern, taken on a mismatch
+    - output link: the nearest state along the failure chain that ends a
+      pattern, so every pattern ending at a position is reported without
+      walking the whole failure chain
+
+Optionally the goto and failure transitions are flattened into a complete
+DFA table (states x alphabet), so each text character costs a single list
+lookup instead of a loop over failure links.
+
+Matching is incremental: feed() scans one chunk of a stream at a time and
+keeps the automaton state between calls, so matches that straddle chunk
+boundaries are found.
+
+Time Complexity:
+    - Build: O(total pattern length), O(states * alphabet) with the DFA
+    - Search: O(n + z) for text length n and z matches
+
+Space Complexity: O(total pattern length), O(states * alphabet) with the DFA
+
+Compared with running KMP once per pattern, which is O(patterns * n).
+"""
+
+
+import os
+import random
+import sys
+import time
+
+from trie import Trie
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over a set of patterns."""
+    
+    def __init__(self, patterns, build_dfa=False):
+        """
+        Build the automaton.
+        
+        Args:
+            patterns: Iterable of pattern strings (empty patterns are ignored)
+            build_dfa: Also build a flat DFA transition table for faster scans
+        """
+        trie = Trie()
+        for pattern in patterns:
+            if pattern:
+                trie.insert(pattern)
+        
+        # Number trie nodes breadth-first; state 0 is the root
+        self.goto = [{}]
+        self.pattern = [None]
+        self.fail = [0]
+        self.output = [-1]
+        queue = [(trie.root, "")]
+        for state, (node, spelled) in enumerate(queue):
+            for char, child in node.children.items():
+                child_state = len(queue)
+                self.goto[state][char] = child_state
+                self.goto.append({})
+                self.pattern.append(spelled + char if child.is_end_of_word else None)
+                queue.append((child, spelled + char))
+                
+                # Parents are numbered first, so their links already exist
+                target = 0
+                if state:
+                    f = self.fail[state]
+                    while f and char not in self.goto[f]:
+                        f = self.fail[f]
+                    target = self.goto[f].get(char, 0)
+                self.fail.append(target)
+                self.output.append(target if self.pattern[target] is not None
+                                   else self.output[target])
+        
+        self.num_states = len(self.goto)
+        self.num_patterns = sum(1 for pattern in self.pattern if pattern is not None)
+        self._table = None
+        if build_dfa:
+            self._build_dfa()
+        self.reset()
+    
+    def _build_dfa(self):
+        """Flatten goto and failure transitions into one table."""
+        alphabet = sorted({char for edges in self.goto for char in edges})
+        self._alphabet = {char: i for i, char in enumerate(alphabet)}
+        width = len(alphabet)
+        table = [0] * (self.num_states * width)
+        
+        # States are in breadth-first order, so fail[state] is complete
+        # before state needs to copy from it
+        for state in range(self.num_states):
+            edges = self.goto[state]
+            base = state * width
+            fallback = self.fail[state] * width
+            for char, i in self._alphabet.items():
+                if char in edges:
+                    table[base + i] = edges[char]
+                elif state:
+                    table[base + i] = table[fallback + i]
+        self._table = table
+        self._width = width
+    
+    def _matches_at(self, state, end, matches):
+        """Append (start, pattern) for every pattern ending at state."""
+        if self.pattern[state] is None:
+            state = self.output[state]
+        while state > 0:
+            pattern = self.pattern[state]
+            matches.append((end - len(pattern) + 1, pattern))
+            state = self.output[state]
+    
+    def _scan(self, text, state, offset):
+        """
+        Run the automaton over text.
+        
+        Returns:
+            Tuple (list of (start, pattern), final state)
+        """
+        matches = []
+        pattern = self.pattern
+        output = self.output
+        
+        if self._table is not None:
+            table, width, alphabet = self._table, self._width, self._alphabet
+            for i, char in enumerate(text):
+                column = alphabet.get(char)
+                state = table[state * width + column] if column is not None else 0
+                if pattern[state] is not None or output[state] > 0:
+                    self._matches_at(state, offset + i, matches)
+            return matches, state
+        
+        goto, fail = self.goto, self.fail
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if pattern[state] is not None or output[state] > 0:
+                self._matches_at(state, offset + i, matches)
+        return matches, state
+    
+    def search(self, text):
+        """
+        Find all occurrences of all patterns in text.
+        
+        Args:
+            text: Text to search
+        
+        Returns:
+            List of (start index, pattern), ordered by end position
+        """
+        return self._scan(text, 0, 0)[0]
+    
+    def feed(self, chunk):
+        """
+        Scan the next chunk of a stream.
+        
+        Positions count from the start of the stream, and a match may begin
+        in an earlier chunk.
+        
+        Args:
+            chunk: Next piece of text
+        
+        Returns:
+            List of (start index, pattern) for matches ending in this chunk
+        """
+        matches, self.state = self._scan(chunk, self.state, self.position)
+        self.position += len(chunk)
+        return matches
+    
+    def reset(self):
+        """Start a new stream."""
+        self.state = 0
+        self.position = 0
+
+
+def benchmark(num_patterns=100, text_length=50_000):
+    """
+    Compare Aho-Corasick with running KMP once per pattern.
+    
+    Args:
+        num_patterns: Number of keywords
+        text_length: Approximate length of the log text
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Algorithms")
+    if path not in sys.path:
+        sys.path.append(path)
+    from kmp_string_matching import kmp_search
+    
+    rng = random.Random(3)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    patterns = sorted({"".join(rng.choice(letters) for _ in range(rng.randint(4, 8)))
+                       for _ in range(num_patterns)})
+    words = [rng.choice(patterns) if rng.random() < 0.05
+             else "".join(rng.choice(letters) for _ in range(rng.randint(2, 9)))
+             for _ in range(text_length // 6)]
+    text = " ".join(words)
+    
+    start = time.perf_counter()
+    expected = sorted((i, pattern) for pattern in patterns
+                      for i in kmp_search(text, pattern))
+    kmp_time = time.perf_counter() - start
+    
+    print(f"  {len(patterns)} patterns, {len(text):,} characters, "
+          f"{len(expected):,} matches")
+    print(f"  KMP per pattern:          {kmp_time * 1000:>8.1f} ms")
+    for label, build_dfa in (("Aho-Corasick (links):", False),
+                             ("Aho-Corasick (DFA):", True)):
+        start = time.perf_counter()
+        automaton = AhoCorasick(patterns, build_dfa=build_dfa)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        found = automaton.search(text)
+        scan_time = time.perf_counter() - start
+        assert sorted(found) == expected
+        print(f"  {label:<25} {scan_time * 1000:>8.1f} ms "
+              f"(+{build_time * 1000:.1f} ms build)")
+
+
+# Example usage
+if __name__ == "__main__":
+    patterns = ["he", "she", "his", "hers"]
+    text = "ushers and his sheep"
+    automaton = AhoCorasick(patterns)
+    
+    print(f"Patterns: {patterns}")
+    print(f"Text: {text}")
+    print(f"\nMatches: {automaton.search(text)}")
+    
+    print("\nStreaming in chunks:")
+    stream = AhoCorasick(["ERROR", "timeout", "disk full"], build_dfa=True)
+    for chunk in ["INFO ok\nERR", "OR: time", "out; disk", " full\n"]:
+        print(f"  feed({chunk!r}): {stream.feed(chunk)}")
+    
+    print("\nBenchmark (KMP per pattern vs Aho-Corasick):")
+    benchmark()
@@ -15,9 +15,27 @@ Time Complexity:
 Space Complexity: O(n)
 
 Note: Performance depends on tree balance. For guaranteed O(log n), use AVL or Red-Black trees.
+
+Keys that arrive in sorted order (timestamps, sequence numbers) turn the plain
+BST into a linked list of height n. Three self-balancing variants with the
+same insert/search/delete/inorder_traversal/height API keep the height
+logarithmic:
+    - AVLTree: subtree heights differ by at most 1 (height <= 1.44 log n).
+      The strictest balance, so the fastest searches.
+    - RedBlackTree: red/black node colors bound the height by 2 log n. At
+      most 2 rotations per insert and 3 per delete.
+    - Treap: each node gets a random priority and the tree is a heap on
+      priorities, so its shape is that of a random BST whatever the
+      insertion order (expected height O(log n)).
+All operations are iterative (explicit paths, parent pointers or stacks),
+so no input order can hit the recursion limit.
 """
 
 
+import random
+import time
+
+
 class TreeNode:
     """Node class for BST."""
     
@@ -33,63 +51,64 @@ class BinarySearchTree:
     def __init__(self):
         self.root = None
     
+    def _replace_child(self, parent, old, new):
+        """Put new where old hangs under parent (or at the root)."""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+    
     def insert(self, data):
         """Insert a value into the BST."""
-        self.root = self._insert_recursive(self.root, data)
-    
-    def _insert_recursive(self, node, data):
-        """Recursive helper for insertion."""
-        if node is None:
-            return TreeNode(data)
-        
-        if data < node.data:
-            node.left = self._insert_recursive(node.left, data)
-        elif data > node.data:
-            node.right = self._insert_recursive(node.right, data)
-        # If data == node.data, do nothing (no duplicates)
+        if self.root is None:
+            self.root = TreeNode(data)
+            return
         
-        return node
+        node = self.root
+        while True:
+            if data < node.data:
+                if node.left is None:
+                    node.left = TreeNode(data)
+                    return
+                node = node.left
+            elif data > node.data:
+                if node.right is None:
+                    node.right = TreeNode(data)
+                    return
+                node = node.right
+            else:
+                # If data == node.data, do nothing (no duplicates)
+                return
     
     def search(self, data):
         """Search for a value in the BST."""
-        return self._search_recursive(self.root, data)
-    
-    def _search_recursive(self, node, data):
-        """Recursive helper for search."""
-        if node is None or node.data == data:
-            return node
-        
-        if data < node.data:
-            return self._search_recursive(node.left, data)
-        else:
-            return self._search_recursive(node.right, data)
+        node = self.root
+        while node is not None and node.data != data:
+            node = node.left if data < node.data else node.right
+        return node
     
     def delete(self, data):
         """Delete a value from the BST."""
-        self.root = self._delete_recursive(self.root, data)
-    
-    def _delete_recursive(self, node, data):
-        """Recursive helper for deletion."""
+        parent, node = None, self.root
+        while node is not None and node.data != data:
+            parent = node
+            node = node.left if data < node.data else node.right
         if node is None:
-            return node
+            return
         
-        if data < node.data:
-            node.left = self._delete_recursive(node.left, data)
-        elif data > node.data:
-            node.right = self._delete_recursive(node.right, data)
-        else:
-            # Node to delete found
-            # Case 1: No child or one child
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            
-            # Case 2: Two children - find inorder successor
-            node.data = self._min_value(node.right)
-            node.right = self._delete_recursive(node.right, node.data)
+        # Case 2: Two children - copy the inorder successor, then delete it
+        if node.left is not None and node.right is not None:
+            parent, successor = node, node.right
+            while successor.left is not None:
+                parent, successor = successor, successor.left
+            node.data = successor.data
+            node = successor
         
-        return node
+        # Case 1: No child or one child
+        child = node.left if node.left is not None else node.right
+        self._replace_child(parent, node, child)
     
     def _min_value(self, node):
         """Find minimum value in a subtree."""
@@ -100,26 +119,410 @@ class BinarySearchTree:
     def inorder_traversal(self):
         """In-order traversal returns sorted values."""
         result = []
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append(node.data)
+            node = node.right
+        return result
+    
+    def height(self):
+        """Calculate height of the BST (-1 for an empty tree)."""
+        height = -1
+        level = [self.root] if self.root is not None else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right)
+                     if child is not None]
+        return height
+
+
+def _rotate_left(node):
+    """Rotate node's right child above it; return the new subtree root."""
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    return pivot
+
+
+def _rotate_right(node):
+    """Rotate node's left child above it; return the new subtree root."""
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    return pivot
+
+
+class AVLNode(TreeNode):
+    """Node class for AVL tree; a leaf has height 1."""
+    
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+
+def _avl_height(node):
+    return node.height if node is not None else 0
+
+
+def _avl_update(node):
+    node.height = 1 + max(_avl_height(node.left), _avl_height(node.right))
+
+
+def _avl_rotate_left(node):
+    pivot = _rotate_left(node)
+    _avl_update(node)
+    _avl_update(pivot)
+    return pivot
+
+
+def _avl_rotate_right(node):
+    pivot = _rotate_right(node)
+    _avl_update(node)
+    _avl_update(pivot)
+    return pivot
+
+
+def _avl_rebalance(node):
+    """Restore the AVL property at node; return the new subtree root."""
+    _avl_update(node)
+    balance = _avl_height(node.left) - _avl_height(node.right)
+    if balance > 1:
+        if _avl_height(node.left.left) < _avl_height(node.left.right):
+            node.left = _avl_rotate_left(node.left)
+        return _avl_rotate_right(node)
+    if balance < -1:
+        if _avl_height(node.right.right) < _avl_height(node.right.left):
+            node.right = _avl_rotate_right(node.right)
+        return _avl_rotate_left(node)
+    return node
+
+
+class AVLTree(BinarySearchTree):
+    """AVL tree: a BST whose subtree heights differ by at most one."""
+    
+    def _fix_path(self, path):
+        """Rebalance the nodes on a root-to-node path, bottom-up."""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            subtree = _avl_rebalance(node)
+            if subtree is not node:
+                self._replace_child(path[i - 1] if i else None, node, subtree)
+            elif node.height == old_height:
+                # Nothing above can change any more
+                return
+    
+    def insert(self, data):
+        """Insert a value into the tree."""
+        path = []
+        node = self.root
+        while node is not None:
+            if data == node.data:
+                return
+            path.append(node)
+            node = node.left if data < node.data else node.right
         
-        def traverse(node):
-            if node:
-                traverse(node.left)
-                result.append(node.data)
-                traverse(node.right)
+        new = AVLNode(data)
+        if not path:
+            self.root = new
+            return
+        if data < path[-1].data:
+            path[-1].left = new
+        else:
+            path[-1].right = new
+        self._fix_path(path)
+    
+    def delete(self, data):
+        """Delete a value from the tree."""
+        path = []
+        node = self.root
+        while node is not None and node.data != data:
+            path.append(node)
+            node = node.left if data < node.data else node.right
+        if node is None:
+            return
         
-        traverse(self.root)
-        return result
+        if node.left is not None and node.right is not None:
+            # Copy the inorder successor, then remove the successor instead
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+        
+        child = node.left if node.left is not None else node.right
+        self._replace_child(path[-1] if path else None, node, child)
+        self._fix_path(path)
     
     def height(self):
-        """Calculate height of the BST."""
-        return self._height_recursive(self.root)
+        """Height of the tree, read from the root in O(1)."""
+        return _avl_height(self.root) - 1
+
+
+RED, BLACK = True, False
+
+
+class RedBlackNode(TreeNode):
+    """Node class for red-black tree, with a parent pointer and a color."""
+    
+    def __init__(self, data, parent=None):
+        super().__init__(data)
+        self.parent = parent
+        self.color = RED
+
+
+def _color(node):
+    """Color of a node; missing (None) leaves are black."""
+    return node.color if node is not None else BLACK
+
+
+class RedBlackTree(BinarySearchTree):
+    """
+    Red-black tree.
+    
+    Every node is red or black, a red node has no red child, and every path
+    from a node down to a missing leaf passes the same number of black nodes.
+    Follows Cormen et al., with None in place of the sentinel leaf.
+    """
+    
+    def _rotate(self, node, left):
+        """Rotate left (or right) at node, keeping parent pointers."""
+        if left:
+            pivot = node.right
+            node.right = pivot.left
+            if pivot.left is not None:
+                pivot.left.parent = node
+        else:
+            pivot = node.left
+            node.left = pivot.right
+            if pivot.right is not None:
+                pivot.right.parent = node
+        pivot.parent = node.parent
+        self._replace_child(node.parent, node, pivot)
+        if left:
+            pivot.left = node
+        else:
+            pivot.right = node
+        node.parent = pivot
+    
+    def insert(self, data):
+        """Insert a value into the tree."""
+        parent, node = None, self.root
+        while node is not None:
+            if data == node.data:
+                return
+            parent = node
+            node = node.left if data < node.data else node.right
+        
+        node = RedBlackNode(data, parent)
+        if parent is None:
+            self.root = node
+        elif data < parent.data:
+            parent.left = node
+        else:
+            parent.right = node
+        
+        # Fix a red node under a red parent
+        while _color(node.parent) == RED:
+            parent = node.parent
+            grandparent = parent.parent
+            on_left = parent is grandparent.left
+            uncle = grandparent.right if on_left else grandparent.left
+            if _color(uncle) == RED:
+                # Recolor and continue from the grandparent
+                parent.color = uncle.color = BLACK
+                grandparent.color = RED
+                node = grandparent
+                continue
+            if node is (parent.right if on_left else parent.left):
+                # Bend the zig-zag into a straight line
+                node = parent
+                self._rotate(node, on_left)
+                parent = node.parent
+            parent.color = BLACK
+            grandparent.color = RED
+            self._rotate(grandparent, not on_left)
+        self.root.color = BLACK
+    
+    def delete(self, data):
+        """Delete a value from the tree."""
+        node = self.search(data)
+        if node is None:
+            return
+        
+        if node.left is not None and node.right is not None:
+            # Copy the inorder successor, then remove the successor instead
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+        
+        # node has at most one child, which takes its place
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        # child may be None, so remember which side it hangs on
+        on_left = parent is not None and parent.left is node
+        if child is not None:
+            child.parent = parent
+        self._replace_child(parent, node, child)
+        if node.color == RED:
+            return
+        
+        # A black node left: child carries an extra black up the tree
+        while child is not self.root and _color(child) == BLACK:
+            sibling = parent.right if on_left else parent.left
+            if _color(sibling) == RED:
+                sibling.color = BLACK
+                parent.color = RED
+                self._rotate(parent, on_left)
+                sibling = parent.right if on_left else parent.left
+            near = sibling.left if on_left else sibling.right
+            far = sibling.right if on_left else sibling.left
+            if _color(near) == BLACK and _color(far) == BLACK:
+                sibling.color = RED
+                child, parent = parent, parent.parent
+                on_left = parent is not None and child is parent.left
+                continue
+            if _color(far) == BLACK:
+                near.color = BLACK
+                sibling.color = RED
+                self._rotate(sibling, not on_left)
+                sibling = parent.right if on_left else parent.left
+                far = sibling.right if on_left else sibling.left
+            sibling.color = parent.color
+            parent.color = BLACK
+            far.color = BLACK
+            self._rotate(parent, on_left)
+            child = self.root
+        if child is not None:
+            child.color = BLACK
+
+
+class TreapNode(TreeNode):
+    """Node class for treap, with a random heap priority."""
+    
+    def __init__(self, data, priority):
+        super().__init__(data)
+        self.priority = priority
+
+
+class Treap(BinarySearchTree):
+    """Treap: a BST on values that is also a max-heap on random priorities."""
+    
+    def __init__(self, seed=None):
+        """
+        Initialize treap.
+        
+        Args:
+            seed: Seed for the priorities, for reproducible shapes
+        """
+        super().__init__()
+        self._random = random.Random(seed).random
     
-    def _height_recursive(self, node):
-        """Recursive helper for height calculation."""
+    def insert(self, data):
+        """Insert a value into the treap."""
+        path = []
+        node = self.root
+        while node is not None:
+            if data == node.data:
+                return
+            path.append(node)
+            node = node.left if data < node.data else node.right
+        
+        node = TreapNode(data, self._random())
+        if not path:
+            self.root = node
+            return
+        if data < path[-1].data:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        
+        # Rotate the new node up while it outranks its parent
+        while path and path[-1].priority < node.priority:
+            parent = path.pop()
+            if parent.left is node:
+                rotated = _rotate_right(parent)
+            else:
+                rotated = _rotate_left(parent)
+            self._replace_child(path[-1] if path else None, parent, rotated)
+    
+    def delete(self, data):
+        """Delete a value from the treap."""
+        parent, node = None, self.root
+        while node is not None and node.data != data:
+            parent = node
+            node = node.left if data < node.data else node.right
         if node is None:
-            return -1
-        return 1 + max(self._height_recursive(node.left),
-                      self._height_recursive(node.right))
+            return
+        
+        # Rotate the node down below its higher-priority child until it
+        # has at most one child, then splice it out
+        while node.left is not None and node.right is not None:
+            if node.left.priority > node.right.priority:
+                rotated = _rotate_right(node)
+            else:
+                rotated = _rotate_left(node)
+            self._replace_child(parent, node, rotated)
+            parent = rotated
+        child = node.left if node.left is not None else node.right
+        self._replace_child(parent, node, child)
+
+
+def benchmark(sizes=(1_000, 20_000), plain_limit=5_000, seed=0):
+    """
+    Compare the trees on sorted, reversed and random insert streams.
+    
+    The plain BST takes O(n^2) on sorted and reversed streams, so it only
+    runs those up to plain_limit keys. Larger sizes (1e5 and up) work the
+    same way with a longer wait.
+    
+    Args:
+        sizes: Numbers of keys
+        plain_limit: Largest ordered stream given to the plain BST
+        seed: Random seed
+    """
+    trees = (("BST", BinarySearchTree), ("AVL", AVLTree),
+             ("Red-black", RedBlackTree), ("Treap", lambda: Treap(seed)))
+    print(f"{'keys':>8} {'stream':>8} {'tree':>10} {'height':>7} {'insert s':>9} "
+          f"{'search s':>9} {'delete s':>9}")
+    for n in sizes:
+        random_keys = list(range(n))
+        random.Random(seed).shuffle(random_keys)
+        streams = (("sorted", list(range(n))), ("reversed", list(range(n - 1, -1, -1))),
+                   ("random", random_keys))
+        for stream_name, keys in streams:
+            for tree_name, make in trees:
+                if tree_name == "BST" and stream_name != "random" and n > plain_limit:
+                    print(f"{n:>8,} {stream_name:>8} {tree_name:>10}   skipped, O(n^2)")
+                    continue
+                tree = make()
+                start = time.perf_counter()
+                for key in keys:
+                    tree.insert(key)
+                insert_time = time.perf_counter() - start
+                height = tree.height()
+                
+                start = time.perf_counter()
+                for key in random_keys:
+                    tree.search(key)
+                search_time = time.perf_counter() - start
+                
+                start = time.perf_counter()
+                for key in random_keys[::2]:
+                    tree.delete(key)
+                delete_time = time.perf_counter() - start
+                assert tree.inorder_traversal() == sorted(random_keys[1::2])
+                print(f"{n:>8,} {stream_name:>8} {tree_name:>10} {height:>7} "
+                      f"{insert_time:>9.3f} {search_time:>9.3f} {delete_time:>9.3f}")
 
 
 # Example usage
@@ -142,4 +545,12 @@ if __name__ == "__main__":
     print("\nDeleting 30:")
     bst.delete(30)
     print(f"In-order after deletion: {bst.inorder_traversal()}")
-
+    
+    print("\nInserting 1..1000 in sorted order:")
+    for tree in (BinarySearchTree(), AVLTree(), RedBlackTree(), Treap(seed=1)):
+        for val in range(1, 1001):
+            tree.insert(val)
+        print(f"  {type(tree).__name__:>16}: height {tree.height()}")
+    
+    print("\nBenchmark (insert streams):")
+    benchmark()
@@ -0,0 +1,548 @@
+"""
+Bloom Filter and Cuckoo Filter (Probabilistic Membership)
+
+A membership filter answers "is this key in the set?" using a few bits per
+key instead of storing the keys. It can return false positives but never
+false negatives, so a "no" is always right and can skip an expensive lookup.
+    - BloomFilter: k hash functions set k bits in a bit array. Sized from the
+      expected number of keys n and a target false-positive rate p:
+      m = -n ln(p) / (ln 2)^2 bits and k = (m / n) ln 2 hashes.
+      Supports union and intersection; does not support deletion.
+    - CuckooFilter: stores a short fingerprint of each key in one of two
+      candidate buckets (partial-key cuckoo hashing), relocating fingerprints
+      when both are full. Supports deletion; false-positive rate is about
+      2 * bucket_size / 2^fingerprint_bits. Fingerprints are bit-packed, so
+      each slot takes exactly fingerprint_bits bits.
+
+FilteredTable puts a filter in front of a HashTable or DiskHashTable so that
+lookups for absent keys usually return without touching the table. Keys are
+hashed through their canonical encoding (hash_table._key_bytes), under which
+keys that compare equal, such as 1, 1.0 and True, look the same; keys with no
+such encoding raise TypeError rather than risk a false negative.
+
+Time Complexity:
+    - Bloom add/contains: O(k)
+    - Cuckoo insert: O(1) amortized, contains/delete: O(1)
+
+Space Complexity: O(m) bits; about 1.44 * log2(1/p) bits per key for Bloom
+"""
+
+
+import hashlib
+import math
+import random
+import struct
+import time
+
+from hash_table import HashTable, _key_bytes
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _hash_pair(key, seed):
+    """Two independent 64-bit hashes of a key from one keyed BLAKE2b digest."""
+    digest = hashlib.blake2b(_key_bytes(key), digest_size=16,
+                             key=seed.to_bytes(16, "little", signed=True)).digest()
+    return (int.from_bytes(digest[:8], "little"),
+            int.from_bytes(digest[8:], "little"))
+
+
+class BloomFilter:
+    """Bloom filter over a compact bytearray bit array."""
+    
+    _HEADER = struct.Struct("<4sQQqQ")
+    _MAGIC = b"BLM1"
+    
+    def __init__(self, capacity, error_rate=0.01, seed=0):
+        """
+        Initialize Bloom filter.
+        
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false-positive rate at that capacity
+            seed: Hash seed; filters must share it to be combined
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        capacity = max(capacity, 1)
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate)
+                                         / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.seed = seed
+        self.count = 0
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, key):
+        """Yield the k bit positions of a key using double hashing."""
+        h1, h2 = _hash_pair(key, self.seed)
+        h2 |= 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+    
+    def add(self, key):
+        """Add a key to the filter."""
+        bits = self.bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def contains(self, key):
+        """Check if a key may be in the set (False means definitely not)."""
+        bits = self.bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+    
+    def __contains__(self, key):
+        return self.contains(key)
+    
+    def estimated_false_positive_rate(self):
+        """Expected false-positive rate given the number of keys added."""
+        k, n, m = self.num_hashes, self.count, self.num_bits
+        return (1 - math.exp(-k * n / m)) ** k
+    
+    def _check_compatible(self, other):
+        if (self.num_bits, self.num_hashes, self.seed) != \
+                (other.num_bits, other.num_hashes, other.seed):
+            raise ValueError("Filters need the same size, hash count and seed")
+    
+    def _combine(self, other, operation):
+        self._check_compatible(other)
+        result = BloomFilter.__new__(BloomFilter)
+        result.num_bits = self.num_bits
+        result.num_hashes = self.num_hashes
+        result.seed = self.seed
+        combined = operation(int.from_bytes(self.bits, "little"),
+                             int.from_bytes(other.bits, "little"))
+        result.bits = bytearray(combined.to_bytes(len(self.bits), "little"))
+        # Estimate how many keys the combined bit pattern represents
+        ones = bin(combined).count("1")
+        if ones < result.num_bits:
+            result.count = round(-result.num_bits / result.num_hashes
+                                 * math.log(1 - ones / result.num_bits))
+        else:
+            result.count = self.count + other.count
+        return result
+    
+    def union(self, other):
+        """Filter matching keys of either filter (exact: OR of the bits)."""
+        return self._combine(other, lambda a, b: a | b)
+    
+    def intersection(self, other):
+        """
+        Filter matching keys of both filters (AND of the bits).
+        
+        The result never misses a common key, but its false-positive rate can
+        be higher than a filter built from the intersection directly.
+        """
+        return self._combine(other, lambda a, b: a & b)
+    
+    def to_bytes(self):
+        """Serialize the filter."""
+        header = self._HEADER.pack(self._MAGIC, self.num_bits, self.num_hashes,
+                                   self.seed, self.count)
+        return header + bytes(self.bits)
+    
+    @classmethod
+    def from_bytes(cls, data):
+        """Deserialize a filter produced by to_bytes()."""
+        magic, num_bits, num_hashes, seed, count = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC:
+            raise ValueError("Not a serialized BloomFilter")
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.seed = seed
+        bloom.count = count
+        bloom.bits = bytearray(data[cls._HEADER.size:])
+        return bloom
+    
+    def __len__(self):
+        """Return number of keys added."""
+        return self.count
+
+
+class _PackedSlots:
+    """Array of fixed-width unsigned ints packed back to back in a bytearray."""
+    
+    def __init__(self, length, bits, data=None):
+        self.length = length
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.nbytes = (length * bits + 7) // 8
+        # Bytes a slot can straddle; the buffer is padded so reads never run short
+        self.span = (bits + 14) // 8
+        self.buffer = bytearray(self.nbytes + self.span)
+        if data is not None:
+            self.buffer[:self.nbytes] = data[:self.nbytes]
+    
+    def __getitem__(self, i):
+        byte, shift = divmod(i * self.bits, 8)
+        word = int.from_bytes(self.buffer[byte:byte + self.span], "little")
+        return (word >> shift) & self.mask
+    
+    def __setitem__(self, i, value):
+        byte, shift = divmod(i * self.bits, 8)
+        span = self.span
+        word = int.from_bytes(self.buffer[byte:byte + span], "little")
+        word = (word & ~(self.mask << shift)) | (value << shift)
+        self.buffer[byte:byte + span] = word.to_bytes(span, "little")
+    
+    def __len__(self):
+        return self.length
+    
+    def tobytes(self):
+        return bytes(self.buffer[:self.nbytes])
+
+
+class CuckooFilter:
+    """Cuckoo filter with multi-slot buckets and up to 16-bit fingerprints."""
+    
+    _HEADER = struct.Struct("<4sQBBqQqqB")
+    _MAGIC = b"CKF1"
+    max_kicks = 500
+    
+    def __init__(self, capacity, bucket_size=4, fingerprint_bits=16, seed=0):
+        """
+        Initialize cuckoo filter.
+        
+        Args:
+            capacity: Expected number of keys
+            bucket_size: Fingerprints per bucket
+            fingerprint_bits: Bits per fingerprint (1-16)
+            seed: Hash seed
+        """
+        if not 1 <= fingerprint_bits <= 16:
+            raise ValueError("fingerprint_bits must be between 1 and 16")
+        # Power-of-two bucket count keeps the alternate index an involution
+        num_buckets = 1
+        while num_buckets * bucket_size * 0.95 < capacity:
+            num_buckets <<= 1
+        self.num_buckets = num_buckets
+        self.bucket_size = bucket_size
+        self.fingerprint_bits = fingerprint_bits
+        self.seed = seed
+        self.count = 0
+        # Slot value 0 means empty, so fingerprints are never 0
+        self.slots = self._allocate_slots(num_buckets * bucket_size, fingerprint_bits)
+        # A fingerprint that could not be placed, kept so it is never lost
+        self.victim = None
+        self._rng = random.Random(seed)
+    
+    @staticmethod
+    def _allocate_slots(num_slots, fingerprint_bits, data=None):
+        """
+        Slot array of fingerprint_bits-wide unsigned ints.
+        
+        8- and 16-bit slots are a plain typed view, which is faster to index;
+        other widths are bit-packed so that no bits are wasted.
+        """
+        if fingerprint_bits not in (8, 16):
+            return _PackedSlots(num_slots, fingerprint_bits, data)
+        fmt, width = ("B", 1) if fingerprint_bits == 8 else ("H", 2)
+        buffer = bytearray(data) if data is not None else bytearray(width * num_slots)
+        return memoryview(buffer).cast(fmt)
+    
+    def _fingerprint_and_index(self, key):
+        h1, h2 = _hash_pair(key, self.seed)
+        fingerprint = (h2 & ((1 << self.fingerprint_bits) - 1)) or 1
+        return fingerprint, h1 & (self.num_buckets - 1)
+    
+    def _alternate(self, index, fingerprint):
+        """Other candidate bucket; applying it twice returns the original."""
+        mixed = ((fingerprint * 0x5BD1E995) & _MASK64) >> 7
+        return (index ^ mixed) & (self.num_buckets - 1)
+    
+    def _bucket_range(self, index):
+        start = index * self.bucket_size
+        return range(start, start + self.bucket_size)
+    
+    def _bucket_has(self, index, fingerprint):
+        slots = self.slots
+        return any(slots[i] == fingerprint for i in self._bucket_range(index))
+    
+    def _bucket_put(self, index, fingerprint):
+        slots = self.slots
+        for i in self._bucket_range(index):
+            if slots[i] == 0:
+                slots[i] = fingerprint
+                return True
+        return False
+    
+    def insert(self, key):
+        """
+        Add a key to the filter.
+        
+        Returns:
+            True on success, False if the filter is too full to take it
+        """
+        if self.victim is not None:
+            return False
+        
+        fingerprint, i1 = self._fingerprint_and_index(key)
+        i2 = self._alternate(i1, fingerprint)
+        if self._bucket_put(i1, fingerprint) or self._bucket_put(i2, fingerprint):
+            self.count += 1
+            return True
+        
+        # Both buckets full: evict random fingerprints along a cuckoo path
+        index = self._rng.choice((i1, i2))
+        for _ in range(self.max_kicks):
+            slot = index * self.bucket_size + self._rng.randrange(self.bucket_size)
+            fingerprint, self.slots[slot] = self.slots[slot], fingerprint
+            index = self._alternate(index, fingerprint)
+            if self._bucket_put(index, fingerprint):
+                self.count += 1
+                return True
+        
+        self.victim = (fingerprint, index)
+        self.count += 1
+        return True
+    
+    def add(self, key):
+        """Add a key, raising if the filter is full (BloomFilter-compatible)."""
+        if not self.insert(key):
+            raise OverflowError("Cuckoo filter is full")
+    
+    def contains(self, key):
+        """Check if a key may be in the set (False means definitely not)."""
+        fingerprint, i1 = self._fingerprint_and_index(key)
+        i2 = self._alternate(i1, fingerprint)
+        if self._bucket_has(i1, fingerprint) or self._bucket_has(i2, fingerprint):
+            return True
+        return (self.victim is not None and self.victim[0] == fingerprint
+                and self.victim[1] in (i1, i2))
+    
+    def __contains__(self, key):
+        return self.contains(key)
+    
+    def delete(self, key):
+        """
+        Remove one copy of a key. Only delete keys that were inserted, or
+        another key sharing the fingerprint may become a false negative.
+        
+        Returns:
+            True if a matching fingerprint was removed
+        """
+        fingerprint, i1 = self._fingerprint_and_index(key)
+        i2 = self._alternate(i1, fingerprint)
+        slots = self.slots
+        
+        if self.victim is not None and self.victim[0] == fingerprint \
+                and self.victim[1] in (i1, i2):
+            self.victim = None
+            self.count -= 1
+            return True
+        
+        for index in (i1, i2):
+            for i in self._bucket_range(index):
+                if slots[i] == fingerprint:
+                    slots[i] = 0
+                    self.count -= 1
+                    self._reinsert_victim()
+                    return True
+        return False
+    
+    def _reinsert_victim(self):
+        """Try to place the stashed fingerprint after a slot frees up."""
+        if self.victim is not None:
+            fingerprint, index = self.victim
+            if self._bucket_put(index, fingerprint) or \
+                    self._bucket_put(self._alternate(index, fingerprint), fingerprint):
+                self.victim = None
+    
+    def load_factor(self):
+        """Fraction of slots in use."""
+        return self.count / (self.num_buckets * self.bucket_size)
+    
+    def to_bytes(self):
+        """Serialize the filter."""
+        has_victim = self.victim is not None
+        victim = self.victim or (0, 0)
+        header = self._HEADER.pack(self._MAGIC, self.num_buckets, self.bucket_size,
+                                   self.fingerprint_bits, self.seed, self.count,
+                                   victim[0], victim[1], has_victim)
+        return header + self.slots.tobytes()
+    
+    @classmethod
+    def from_bytes(cls, data):
+        """Deserialize a filter produced by to_bytes()."""
+        (magic, num_buckets, bucket_size, fingerprint_bits, seed, count,
+         victim_fingerprint, victim_index, has_victim) = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC:
+            raise ValueError("Not a serialized CuckooFilter")
+        cuckoo = cls.__new__(cls)
+        cuckoo.num_buckets = num_buckets
+        cuckoo.bucket_size = bucket_size
+        cuckoo.fingerprint_bits = fingerprint_bits
+        cuckoo.seed = seed
+        cuckoo.count = count
+        cuckoo.slots = cls._allocate_slots(num_buckets * bucket_size, fingerprint_bits,
+                                           data[cls._HEADER.size:])
+        cuckoo.victim = (victim_fingerprint, victim_index) if has_victim else None
+        cuckoo._rng = random.Random(seed)
+        return cuckoo
+    
+    def __len__(self):
+        """Return number of keys stored."""
+        return self.count
+
+
+class FilteredTable:
+    """
+    A HashTable (or DiskHashTable) with a membership filter in front.
+    
+    contains() and get() consult the filter first and only touch the table
+    when the key may be present, which makes misses cheap.
+    """
+    
+    def __init__(self, table, membership_filter=None, error_rate=0.01, capacity=None):
+        """
+        Wrap a table, adding its existing keys to the filter.
+        
+        Args:
+            table: Object with get/contains (and insert/delete if writable)
+            membership_filter: BloomFilter or CuckooFilter, sized by the
+                caller (default: a Bloom filter that grows with the table)
+            error_rate: False-positive rate of the default Bloom filter
+            capacity: Keys the default Bloom filter is sized for (default:
+                twice the table's current size, at least 1024)
+        """
+        self.table = table
+        self.error_rate = error_rate
+        self.filtered_misses = 0
+        if membership_filter is None:
+            self.capacity = capacity or max(2 * len(table), 1024)
+            self._rebuild_filter()
+        else:
+            # The caller owns the filter's sizing
+            self.capacity = None
+            self.filter = membership_filter
+            for key in table.keys():
+                self.filter.add(key)
+    
+    def _rebuild_filter(self):
+        """Build the default Bloom filter for self.capacity keys from the table."""
+        self.filter = BloomFilter(self.capacity, self.error_rate)
+        for key in self.table.keys():
+            self.filter.add(key)
+    
+    def insert(self, key, value):
+        """Insert or update key-value pair."""
+        if not self.table.contains(key):
+            self.filter.add(key)
+        self.table.insert(key, value)
+        # Past its capacity a Bloom filter's false-positive rate keeps rising,
+        # so regrow the default one; doubling keeps this O(1) amortized
+        if self.capacity is not None and len(self.table) > self.capacity:
+            self.capacity *= 2
+            self._rebuild_filter()
+    
+    def get(self, key):
+        """Get value for a key."""
+        if not self.filter.contains(key):
+            self.filtered_misses += 1
+            raise KeyError(f"Key '{key}' not found")
+        return self.table.get(key)
+    
+    def contains(self, key):
+        """Check if key exists."""
+        if not self.filter.contains(key):
+            self.filtered_misses += 1
+            return False
+        return self.table.contains(key)
+    
+    def delete(self, key):
+        """Delete key-value pair (a Bloom filter keeps the key as a positive)."""
+        deleted = self.table.delete(key)
+        if deleted and hasattr(self.filter, "delete"):
+            self.filter.delete(key)
+        return deleted
+    
+    def __len__(self):
+        """Return number of key-value pairs."""
+        return len(self.table)
+
+
+def benchmark(n=50_000, probes=100_000):
+    """
+    Measure false-positive rate against memory for both filters.
+    
+    Args:
+        n: Number of keys inserted into each filter
+        probes: Number of absent keys used to measure false positives
+    """
+    keys = [f"user:{i}" for i in range(n)]
+    absent = [f"ghost:{i}" for i in range(probes)]
+    
+    configs = [(f"bloom p={p}", BloomFilter(n, error_rate=p))
+               for p in (0.1, 0.01, 0.001)]
+    configs += [(f"cuckoo f={bits}", CuckooFilter(n, fingerprint_bits=bits))
+                for bits in (8, 12, 16)]
+    
+    print(f"{'filter':>16} {'bits/key':>9} {'measured FP':>12} {'contains/s':>11}")
+    for name, membership_filter in configs:
+        for key in keys:
+            membership_filter.add(key)
+        if isinstance(membership_filter, BloomFilter):
+            bits = membership_filter.num_bits
+        else:
+            bits = membership_filter.slots.nbytes * 8
+        
+        start = time.perf_counter()
+        false_positives = sum(1 for key in absent if membership_filter.contains(key))
+        rate = probes / (time.perf_counter() - start)
+        print(f"{name:>16} {bits / n:>9.1f} {false_positives / probes:>12.4%} "
+              f"{rate:>11,.0f}")
+    
+    table = HashTable.from_items((key, True) for key in keys)
+    front = FilteredTable(table)
+    for key in absent:
+        front.contains(key)
+    print(f"\nNegative lookups answered by the filter alone: "
+          f"{front.filtered_misses / probes:.2%}")
+
+
+# Example usage
+if __name__ == "__main__":
+    print("Bloom filter (1,000 keys, 1% error rate):")
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for word in ["apple", "banana", "cherry"]:
+        bloom.add(word)
+    print(f"  {bloom.num_bits} bits, {bloom.num_hashes} hashes")
+    print(f"  'apple' in filter: {'apple' in bloom}")
+    print(f"  'grape' in filter: {'grape' in bloom}")
+    
+    other = BloomFilter(1000, error_rate=0.01)
+    other.add("grape")
+    other.add("apple")
+    print(f"  Union has 'grape': {'grape' in bloom.union(other)}")
+    print(f"  Intersection has 'apple': {'apple' in bloom.intersection(other)}, "
+          f"'banana': {'banana' in bloom.intersection(other)}")
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+    print(f"  Restored from {len(bloom.to_bytes())} bytes, has 'cherry': "
+          f"{'cherry' in restored}")
+    
+    print("\nCuckoo filter (supports deletion):")
+    cuckoo = CuckooFilter(1000)
+    for word in ["apple", "banana", "cherry"]:
+        cuckoo.insert(word)
+    cuckoo.delete("banana")
+    print(f"  'apple': {'apple' in cuckoo}, 'banana': {'banana' in cuckoo}")
+    restored = CuckooFilter.from_bytes(cuckoo.to_bytes())
+    print(f"  Restored, has 'cherry': {'cherry' in restored}")
+    
+    print("\nFilteredTable in front of a HashTable:")
+    ht = HashTable()
+    ht.insert("apple", 5)
+    front = FilteredTable(ht, CuckooFilter(1000))
+    front.insert("banana", 3)
+    print(f"  get('banana'): {front.get('banana')}")
+    print(f"  contains('kiwi'): {front.contains('kiwi')} "
+          f"(filtered misses: {front.filtered_misses})")
+    
+    print("\nBenchmark (false-positive rate vs memory):")
+    benchmark()
@@ -0,0 +1,396 @@
+"""
+Bounded Caches (LRU, LFU, TTL)
+
+A cache keeps the most useful recent results of expensive work within a
+fixed budget, evicting entries when the budget is exceeded. Each cache here
+combines a HashTable (key -> list node) with DoublyLinkedList ordering, so
+every operation is O(1):
+    - LRUCache: evicts the least recently used entry.
+    - LFUCache: evicts the least frequently used entry (oldest among ties),
+      keeping one list per access count.
+    - TTLCache: entries expire ttl seconds after they were written; when
+      over budget, the entry closest to expiry is evicted first.
+
+The budget is max_entries, max_bytes, or both. Entry sizes come from a sizeof
+function (default: sys.getsizeof of key plus value). All caches count hits,
+misses and evictions, and memoize() turns any of them into a decorator.
+
+Time Complexity:
+    - Get: O(1) average
+    - Insert: O(1) average (amortized over evictions)
+    - Delete: O(1) average
+
+Space Complexity: O(n) for n cached entries
+"""
+
+
+import sys
+import time
+from functools import wraps
+
+from doubly_linked_list import DoublyLinkedList
+from hash_table import HashTable
+
+# Separates positional from keyword arguments in memoize keys
+_KWARGS_MARK = object()
+
+
+def _default_sizeof(key, value):
+    """Approximate the memory held by one entry."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class LRUCache:
+    """Least-recently-used cache with an entry and/or byte budget."""
+    
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=None):
+        """
+        Initialize cache.
+        
+        Args:
+            max_entries: Maximum number of entries (None for no limit)
+            max_bytes: Maximum total entry size in bytes (None for no limit)
+            sizeof: Function (key, value) -> bytes used for max_bytes
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("Set max_entries, max_bytes or both")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or _default_sizeof
+        self.table = HashTable()
+        # Eviction order: the head is evicted first
+        self.order = DoublyLinkedList()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def _entry_size(self, key, value):
+        """Size of an entry, computed only when a byte budget is set."""
+        return self.sizeof(key, value) if self.max_bytes is not None else 0
+    
+    def _find(self, key):
+        """Return the node for a key, or None if it is not cached."""
+        try:
+            return self.table.get(key)
+        except KeyError:
+            return None
+    
+    def _touch(self, node):
+        """Record an access to a cached node."""
+        self.order.move_to_end(node)
+    
+    def _unlink(self, node):
+        """Remove a node from the ordering structure."""
+        self.order.remove_node(node)
+    
+    def _link(self, entry):
+        """Add a new entry [key, value, nbytes] and return its node."""
+        return self.order.append(entry)
+    
+    def _victim(self):
+        """Return the node to evict next."""
+        return self.order.head
+    
+    def _remove(self, node):
+        """Drop a node from both the table and the ordering structure."""
+        key, _, nbytes = node.data[:3]
+        self._unlink(node)
+        self.table.delete(key)
+        self.current_bytes -= nbytes
+    
+    def _over_budget(self, extra_entries, extra_bytes):
+        """Check whether adding entries of the given size would exceed the budget."""
+        if (self.max_entries is not None
+                and len(self.table) + extra_entries > self.max_entries):
+            return True
+        if (self.max_bytes is not None
+                and self.current_bytes + extra_bytes > self.max_bytes):
+            return True
+        return False
+    
+    def _make_room(self, extra_entries, extra_bytes):
+        """Evict entries until one more entry of extra_bytes fits."""
+        while len(self.table) and self._over_budget(extra_entries, extra_bytes):
+            self._remove(self._victim())
+            self.evictions += 1
+    
+    def get(self, key):
+        """Get value for a key, counting a hit or a miss."""
+        node = self._find(key)
+        if node is None:
+            self.misses += 1
+            raise KeyError(f"Key '{key}' not found")
+        
+        self.hits += 1
+        self._touch(node)
+        return node.data[1]
+    
+    def insert(self, key, value):
+        """Insert or update key-value pair, evicting entries if needed."""
+        nbytes = self._entry_size(key, value)
+        node = self._find(key)
+        
+        if node is not None:
+            self.current_bytes += nbytes - node.data[2]
+            node.data[1] = value
+            node.data[2] = nbytes
+            self._touch(node)
+            self._make_room(0, 0)
+            return
+        
+        # Entries larger than the whole budget are never cached
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        
+        self._make_room(1, nbytes)
+        self.table.insert(key, self._link([key, value, nbytes]))
+        self.current_bytes += nbytes
+    
+    def delete(self, key):
+        """Delete key-value pair."""
+        node = self._find(key)
+        if node is None:
+            return False
+        self._remove(node)
+        return True
+    
+    def contains(self, key):
+        """Check if key is cached, without affecting statistics or order."""
+        return self._find(key) is not None
+    
+    def stats(self):
+        """Return hit/miss/eviction counters and current usage."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.table),
+            "bytes": self.current_bytes,
+        }
+    
+    def __len__(self):
+        """Return number of cached entries."""
+        return len(self.table)
+    
+    def __str__(self):
+        """String representation, in eviction order."""
+        items = []
+        node = self.order.head
+        while node:
+            items.append(f"{node.data[0]}: {node.data[1]}")
+            node = node.next
+        return "{" + ", ".join(items) + "}"
+
+
+class LFUCache(LRUCache):
+    """
+    Least-frequently-used cache.
+    
+    Entries with the same access count share a DoublyLinkedList (a bucket),
+    and the buckets form another DoublyLinkedList sorted by count. An access
+    moves an entry into the next bucket, inserting one for count + 1 if it
+    is missing, so the first bucket always holds the smallest count and
+    finding the victim is O(1) without searching; within a count, the oldest
+    entry goes first.
+    """
+    
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=None):
+        super().__init__(max_entries, max_bytes, sizeof)
+        # Nodes holding [count, DoublyLinkedList of entries], by ascending count
+        self.buckets = DoublyLinkedList()
+    
+    @property
+    def min_frequency(self):
+        """Smallest access count among cached entries (0 when empty)."""
+        head = self.buckets.head
+        return head.data[0] if head else 0
+    
+    def _unlink(self, node):
+        bucket = node.data[3]
+        bucket.data[1].remove_node(node)
+        if bucket.data[1].is_empty():
+            self.buckets.remove_node(bucket)
+    
+    def _touch(self, node):
+        bucket = node.data[3]
+        frequency = bucket.data[0] + 1
+        target = bucket.next
+        if target is None or target.data[0] != frequency:
+            target = self.buckets.insert_after(bucket, [frequency, DoublyLinkedList()])
+        self._unlink(node)
+        node.data[3] = target
+        target.data[1].append_node(node)
+    
+    def _link(self, entry):
+        bucket = self.buckets.head
+        if bucket is None or bucket.data[0] != 1:
+            bucket = self.buckets.prepend([1, DoublyLinkedList()])
+        entry.append(bucket)
+        return bucket.data[1].append(entry)
+    
+    def _victim(self):
+        return self.buckets.head.data[1].head
+    
+    def __str__(self):
+        """String representation with access counts."""
+        items = []
+        bucket = self.buckets.head
+        while bucket:
+            frequency, nodes = bucket.data
+            node = nodes.head
+            while node:
+                items.append(f"{node.data[0]}: {node.data[1]} (x{frequency})")
+                node = node.next
+            bucket = bucket.next
+        return "{" + ", ".join(items) + "}"
+
+
+class TTLCache(LRUCache):
+    """
+    Cache whose entries expire ttl seconds after being written.
+    
+    Writes move an entry to the tail with a fresh deadline, so the list stays
+    sorted by expiry time and expired entries are always at the head.
+    """
+    
+    def __init__(self, ttl, max_entries=None, max_bytes=None, sizeof=None,
+                 timer=time.monotonic):
+        """
+        Initialize cache.
+        
+        Args:
+            ttl: Lifetime of an entry in seconds
+            max_entries: Maximum number of entries (None for no limit)
+            max_bytes: Maximum total entry size in bytes (None for no limit)
+            sizeof: Function (key, value) -> bytes used for max_bytes
+            timer: Clock returning seconds (default: time.monotonic)
+        """
+        if max_entries is None and max_bytes is None:
+            max_entries = sys.maxsize
+        super().__init__(max_entries, max_bytes, sizeof)
+        self.ttl = ttl
+        self.timer = timer
+        self.expirations = 0
+    
+    def _expire(self):
+        """Drop every entry whose deadline has passed."""
+        now = self.timer()
+        while self.order.head and self.order.head.data[3] <= now:
+            self._remove(self.order.head)
+            self.expirations += 1
+    
+    def _find(self, key):
+        self._expire()
+        return super()._find(key)
+    
+    def _touch(self, node):
+        # Reads do not extend the lifetime; only insert() refreshes it
+        pass
+    
+    def _link(self, entry):
+        entry.append(self.timer() + self.ttl)
+        return self.order.append(entry)
+    
+    def insert(self, key, value):
+        """Insert or update key-value pair with a fresh deadline."""
+        self.delete(key)
+        super().insert(key, value)
+    
+    def stats(self):
+        """Return counters, including expired entries."""
+        result = super().stats()
+        result["expirations"] = self.expirations
+        return result
+
+
+def memoize(cache):
+    """
+    Decorator caching a pure function's results in the given cache.
+    
+    Positional and keyword arguments form the key, so they must be hashable.
+    The wrapper exposes the cache as .cache for inspecting statistics.
+    
+    Args:
+        cache: An LRUCache, LFUCache or TTLCache instance
+    
+    Returns:
+        Decorator for the function
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            try:
+                return cache.get(key)
+            except KeyError:
+                result = function(*args, **kwargs)
+                cache.insert(key, result)
+                return result
+        
+        wrapper.cache = cache
+        return wrapper
+    
+    return decorator
+
+
+# Example usage
+if __name__ == "__main__":
+    print("LRU cache (max 3 entries):")
+    lru = LRUCache(max_entries=3)
+    for key in ["a", "b", "c"]:
+        lru.insert(key, key.upper())
+    lru.get("a")
+    lru.insert("d", "D")
+    print(f"  After touching 'a' and adding 'd': {lru}")
+    print(f"  Stats: {lru.stats()}")
+    
+    print("\nLFU cache (max 3 entries):")
+    lfu = LFUCache(max_entries=3)
+    for key in ["a", "b", "c"]:
+        lfu.insert(key, key.upper())
+    for key in ["a", "a", "b"]:
+        lfu.get(key)
+    lfu.insert("d", "D")
+    print(f"  After using 'a' twice and 'b' once, adding 'd': {lfu}")
+    
+    print("\nTTL cache (ttl=10s, simulated clock):")
+    clock = [0.0]
+    ttl_cache = TTLCache(ttl=10, timer=lambda: clock[0])
+    ttl_cache.insert("session", "token-1")
+    clock[0] = 5.0
+    print(f"  At t=5: contains 'session' = {ttl_cache.contains('session')}")
+    clock[0] = 11.0
+    print(f"  At t=11: contains 'session' = {ttl_cache.contains('session')}")
+    print(f"  Stats: {ttl_cache.stats()}")
+    
+    print("\nByte-budgeted LRU cache (max 400 bytes):")
+    sized = LRUCache(max_bytes=400)
+    for i in range(10):
+        sized.insert(i, "x" * 50)
+    print(f"  Kept {len(sized)} entries using {sized.current_bytes} bytes")
+    
+    print("\nMemoized functions:")
+    
+    @memoize(LRUCache(max_entries=1000))
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+    
+    @memoize(LFUCache(max_entries=10_000))
+    def partitions(n, largest):
+        """Count partitions of n into parts of size at most largest."""
+        if n == 0:
+            return 1
+        if n < 0 or largest == 0:
+            return 0
+        return partitions(n - largest, largest) + partitions(n, largest - 1)
+    
+    start = time.perf_counter()
+    print(f"  fibonacci(300) = {fibonacci(300)}")
+    print(f"  partitions(60, 60) = {partitions(60, 60)}")
+    print(f"  Took {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"  fibonacci cache: {fibonacci.cache.stats()}")
@@ -0,0 +1,402 @@
+"""
+Consistent Hashing
+
+Consistent hashing maps keys to partitions so that changing the set of
+partitions only moves a small share of keys. With plain hash(key) % N,
+going from N to N + 1 partitions moves almost every key; with a consistent
+hash ring only about 1 / (N + 1) of them move.
+    
+    - ConsistentHashRing: each node is placed at many points ("virtual nodes")
+      on a 64-bit ring; a key belongs to the first point clockwise from its
+      hash. More virtual nodes give a more even load.
+    - jump_consistent_hash: Lamping and Veach's jump hash. No ring to store
+      and a near-perfect balance, but partitions are numbered 0..N-1 and can
+      only be added or removed at the end.
+    - PartitionedHashTable: a local multi-process store where every partition
+      is a HashTable living in its own worker process, routed by a ring.
+
+Keys and virtual nodes are hashed with hash_table.make_seeded_hash, which
+gives the same result in every process and across restarts.
+
+Time Complexity:
+    - Ring lookup: O(log(N * V)) for N nodes with V virtual nodes each
+    - Add/remove node: O(N * V log(N * V))
+    - Jump hash: O(log N)
+
+Space Complexity: O(N * V) for the ring
+"""
+
+
+import bisect
+import multiprocessing
+import statistics
+import time
+
+from hash_table import HashTable, make_seeded_hash
+
+
+class ConsistentHashRing:
+    """Hash ring with virtual nodes."""
+    
+    def __init__(self, nodes=(), vnodes=100, hash_function=None):
+        """
+        Initialize ring.
+        
+        Args:
+            nodes: Initial node names
+            vnodes: Points placed on the ring per node
+            hash_function: Callable mapping a key to an int (default: a
+                seeded hash that is stable across processes)
+        """
+        self.vnodes = vnodes
+        self.hash_function = hash_function or make_seeded_hash(0)
+        self.nodes = []
+        self._points = []
+        self._owners = []
+        for node in nodes:
+            self.add_node(node)
+    
+    def _rebuild(self):
+        """Recompute the sorted ring points from the node list."""
+        ring = sorted((self.hash_function(f"{node}#{i}"), node)
+                      for node in self.nodes for i in range(self.vnodes))
+        self._points = [point for point, _ in ring]
+        self._owners = [node for _, node in ring]
+    
+    def get_node(self, key):
+        """Return the node responsible for a key."""
+        if not self._points:
+            raise LookupError("Ring has no nodes")
+        i = bisect.bisect(self._points, self.hash_function(key))
+        return self._owners[i if i < len(self._points) else 0]
+    
+    def _change(self, mutate, keys):
+        """Apply a membership change and report which keys changed owner."""
+        before = [(key, self.get_node(key)) for key in keys] if self._points else []
+        mutate()
+        self._rebuild()
+        if not self._points:
+            return []
+        moved = []
+        for key, old in before:
+            new = self.get_node(key)
+            if new != old:
+                moved.append((key, old, new))
+        return moved
+    
+    def add_node(self, node, keys=()):
+        """
+        Add a node to the ring.
+        
+        Args:
+            node: Node name
+            keys: Keys to check for movement
+        
+        Returns:
+            List of (key, old_node, new_node) for keys in `keys` that moved
+        """
+        if node in self.nodes:
+            raise ValueError(f"Node '{node}' already in ring")
+        return self._change(lambda: self.nodes.append(node), keys)
+    
+    def remove_node(self, node, keys=()):
+        """
+        Remove a node from the ring.
+        
+        Args:
+            node: Node name
+            keys: Keys to check for movement
+        
+        Returns:
+            List of (key, old_node, new_node) for keys in `keys` that moved
+        """
+        return self._change(lambda: self.nodes.remove(node), keys)
+    
+    def load(self, keys):
+        """Count how many of the given keys each node owns."""
+        counts = {node: 0 for node in self.nodes}
+        for key in keys:
+            counts[self.get_node(key)] += 1
+        return counts
+    
+    def __len__(self):
+        """Return number of nodes."""
+        return len(self.nodes)
+
+
+def jump_consistent_hash(key_hash, num_buckets):
+    """
+    Map a 64-bit key hash to a bucket in [0, num_buckets) (Lamping & Veach).
+    
+    Growing num_buckets by one moves only the keys that land in the new bucket.
+    
+    Args:
+        key_hash: Non-negative 64-bit hash of the key
+        num_buckets: Number of buckets
+    
+    Returns:
+        Bucket number
+    """
+    b, j = -1, 0
+    key_hash &= (1 << 64) - 1
+    while j < num_buckets:
+        b = j
+        key_hash = (key_hash * 2862933555777941757 + 1) & ((1 << 64) - 1)
+        j = int((b + 1) * ((1 << 31) / ((key_hash >> 33) + 1)))
+    return b
+
+
+def _partition_worker(conn):
+    """Serve HashTable operations for one partition until told to close."""
+    table = HashTable()
+    operations = {
+        "insert": table.insert,
+        "find_many": lambda keys: _find_many(table, keys),
+        "insert_many": table.insert_many,
+        "delete": table.delete,
+        "keys": lambda: list(table.keys()),
+        "pop_many": lambda keys: _pop_many(table, keys),
+        "len": lambda: len(table),
+    }
+    while True:
+        operation, args = conn.recv()
+        if operation == "close":
+            break
+        try:
+            conn.send((True, operations[operation](*args)))
+        except Exception as error:
+            conn.send((False, error))
+    conn.close()
+
+
+def _find_many(table, keys):
+    """Return a dict of the given keys that are present in a table."""
+    missing = object()
+    values = table.get_many(keys, default=missing)
+    return {key: value for key, value in zip(keys, values) if value is not missing}
+
+
+def _pop_many(table, keys):
+    """Remove keys from a table, returning their (key, value) pairs."""
+    found = _find_many(table, keys)
+    table.delete_many(keys)
+    return list(found.items())
+
+
+class PartitionedHashTable:
+    """
+    Key space split over HashTables in separate worker processes.
+    
+    Each call is one round trip through a pipe, so the batch methods, which
+    send one message per partition, are much faster than per-key calls.
+    Adding or removing a partition migrates only the keys whose owner
+    changes on the ring.
+    """
+    
+    def __init__(self, num_partitions=4, vnodes=100):
+        """
+        Start worker processes.
+        
+        Args:
+            num_partitions: Number of partitions (processes) to start
+            vnodes: Virtual nodes per partition on the ring
+        """
+        self.ring = ConsistentHashRing(vnodes=vnodes)
+        self._workers = {}
+        for i in range(num_partitions):
+            self.add_partition(f"partition-{i}")
+    
+    def _call(self, partition, operation, *args):
+        """Run an operation in a partition's process and return its result."""
+        conn = self._workers[partition][1]
+        conn.send((operation, args))
+        ok, result = conn.recv()
+        if not ok:
+            raise result
+        return result
+    
+    def _group(self, keys):
+        """Split keys by owning partition."""
+        groups = {}
+        for key in keys:
+            groups.setdefault(self.ring.get_node(key), []).append(key)
+        return groups
+    
+    def add_partition(self, name):
+        """
+        Start a new partition and move the keys it now owns into it.
+        
+        Returns:
+            Number of keys migrated
+        
+        Raises:
+            ValueError: If a partition with this name already exists
+        """
+        if name in self._workers:
+            raise ValueError(f"Partition '{name}' already exists")
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_partition_worker, args=(child_conn,),
+                                          daemon=True)
+        process.start()
+        child_conn.close()
+        
+        keys = [key for partition in self._workers
+                for key in self._call(partition, "keys")]
+        self._workers[name] = (process, parent_conn)
+        moved = self.ring.add_node(name, keys)
+        return self._migrate(moved)
+    
+    def remove_partition(self, name):
+        """
+        Move a partition's keys to their new owners and stop its process.
+        
+        Returns:
+            Number of keys migrated
+        """
+        keys = self._call(name, "keys")
+        moved = self.ring.remove_node(name, keys)
+        count = self._migrate(moved)
+        process, conn = self._workers.pop(name)
+        conn.send(("close", ()))
+        process.join()
+        return count
+    
+    def _migrate(self, moved):
+        """Move (key, old, new) entries between partitions in batches."""
+        batches = {}
+        for key, old, new in moved:
+            batches.setdefault((old, new), []).append(key)
+        for (old, new), keys in batches.items():
+            pairs = self._call(old, "pop_many", keys)
+            self._call(new, "insert_many", pairs)
+        return len(moved)
+    
+    def insert(self, key, value):
+        """Insert or update key-value pair."""
+        self._call(self.ring.get_node(key), "insert", key, value)
+    
+    def get(self, key):
+        """Get value for a key."""
+        found = self._call(self.ring.get_node(key), "find_many", [key])
+        if key not in found:
+            raise KeyError(f"Key '{key}' not found")
+        return found[key]
+    
+    def contains(self, key):
+        """Check if key exists."""
+        try:
+            self.get(key)
+            return True
+        except KeyError:
+            return False
+    
+    def delete(self, key):
+        """Delete key-value pair."""
+        return self._call(self.ring.get_node(key), "delete", key)
+    
+    def insert_many(self, pairs):
+        """Insert many pairs with one message per partition."""
+        values = dict(pairs)
+        for partition, keys in self._group(values).items():
+            self._call(partition, "insert_many", [(key, values[key]) for key in keys])
+    
+    def get_many(self, keys, default=None):
+        """Look up many keys with one message per partition."""
+        keys = list(keys)
+        found = {}
+        for partition, group in self._group(keys).items():
+            found.update(self._call(partition, "find_many", group))
+        return [found.get(key, default) for key in keys]
+    
+    def partition_sizes(self):
+        """Return the number of keys stored in each partition."""
+        return {name: self._call(name, "len") for name in self._workers}
+    
+    def close(self):
+        """Stop all worker processes."""
+        for process, conn in self._workers.values():
+            conn.send(("close", ()))
+            process.join()
+        self._workers.clear()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        """Return number of key-value pairs."""
+        return sum(self.partition_sizes().values())
+
+
+def benchmark(num_nodes=10, num_keys=100_000, vnode_counts=(1, 10, 100, 1000)):
+    """
+    Measure lookup latency, load balance and key movement per vnode count.
+    
+    Balance is the standard deviation of keys per node as a percentage of
+    the mean. "Moved" is the share of keys that change owner when one more
+    node is added; the ideal is 1 / (num_nodes + 1).
+    
+    Args:
+        num_nodes: Nodes on the ring
+        num_keys: Keys to distribute
+        vnode_counts: Virtual node counts to compare
+    """
+    keys = [f"user:{i}" for i in range(num_keys)]
+    nodes = [f"node-{i}" for i in range(num_nodes)]
+    print(f"{'scheme':>14} {'lookup us':>10} {'stddev %':>9} {'moved %':>8}")
+    
+    for vnodes in vnode_counts:
+        ring = ConsistentHashRing(nodes, vnodes=vnodes)
+        start = time.perf_counter()
+        load = ring.load(keys)
+        lookup_us = (time.perf_counter() - start) / num_keys * 1e6
+        spread = statistics.pstdev(load.values()) / (num_keys / num_nodes) * 100
+        moved = len(ring.add_node("extra", keys)) / num_keys * 100
+        print(f"{f'ring v={vnodes}':>14} {lookup_us:>10.2f} {spread:>9.1f} {moved:>8.1f}")
+    
+    hash_key = make_seeded_hash(0)
+    hashes = [hash_key(key) for key in keys]
+    start = time.perf_counter()
+    buckets = [jump_consistent_hash(h, num_nodes) for h in hashes]
+    lookup_us = (time.perf_counter() - start) / num_keys * 1e6
+    counts = [buckets.count(b) for b in range(num_nodes)]
+    spread = statistics.pstdev(counts) / (num_keys / num_nodes) * 100
+    moved = sum(1 for h, b in zip(hashes, buckets)
+                if jump_consistent_hash(h, num_nodes + 1) != b) / num_keys * 100
+    print(f"{'jump hash':>14} {lookup_us:>10.2f} {spread:>9.1f} {moved:>8.1f}")
+    print(f"  (jump hash lookup excludes hashing the key; ideal moved % is "
+          f"{100 / (num_nodes + 1):.1f})")
+
+
+# Example usage
+if __name__ == "__main__":
+    print("Consistent hash ring with 3 nodes:")
+    ring = ConsistentHashRing(["cache-a", "cache-b", "cache-c"], vnodes=100)
+    keys = [f"user:{i}" for i in range(1000)]
+    for key in keys[:3]:
+        print(f"  {key} -> {ring.get_node(key)}")
+    print(f"  Load: {ring.load(keys)}")
+    
+    moved = ring.add_node("cache-d", keys)
+    print(f"\nAdding cache-d moved {len(moved)} of {len(keys)} keys, e.g. "
+          f"{moved[0][0]}: {moved[0][1]} -> {moved[0][2]}")
+    
+    print("\nJump consistent hash (5 buckets):")
+    hash_key = make_seeded_hash(0)
+    print(f"  {[jump_consistent_hash(hash_key(key), 5) for key in keys[:8]]}")
+    
+    print("\nPartitioned HashTable across worker processes:")
+    with PartitionedHashTable(num_partitions=3) as table:
+        table.insert_many((key, len(key)) for key in keys)
+        print(f"  get('user:42'): {table.get('user:42')}")
+        print(f"  Partition sizes: {table.partition_sizes()}")
+        migrated = table.add_partition("partition-3")
+        print(f"  Added partition-3, migrated {migrated} keys")
+        print(f"  Partition sizes: {table.partition_sizes()}")
+        print(f"  All keys still found: "
+              f"{all(v == len(k) for k, v in zip(keys, table.get_many(keys)))}")
+    
+    print("\nBenchmark (balance vs virtual nodes):")
+    benchmark()
@@ -0,0 +1,358 @@
+"""
+Memory-Mapped On-Disk Hash Table
+
+An immutable hash table stored in a single file, in the spirit of D. J.
+Bernstein's CDB. It is built once from a HashTable (or any iterable of
+key-value pairs) and then opened with mmap, so opening is O(1): nothing is
+parsed or copied up front, and a lookup only touches the pages holding its
+slot and its record. Processes that open the same file share one copy in
+the operating system's page cache instead of each building its own table.
+
+File layout (little-endian):
+    header   magic "DHT1", version u32, count u64, num_slots u64,
+             slots_offset u64, seed i128
+    records  key_len u32, value_len u32, key bytes, value bytes (pickled)
+    slots    num_slots x (hash u64, record_offset u64); offset 0 = empty
+
+Keys may be str, bytes, int, float, None or tuples of those, and keys that
+compare equal (1, 1.0 and True) find the same entry, as in HashTable. They
+are hashed with the seeded, process-independent hash from
+hash_table.make_seeded_hash. The seed is stored in the header, so readers
+need not know it, and the slot table uses linear probing at a
+load factor of at most 0.5.
+
+Time Complexity:
+    - Build: O(n)
+    - Open: O(1)
+    - Search: O(1) average
+
+Space Complexity: O(n) on disk; O(1) resident memory beyond touched pages
+"""
+
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+
+from hash_table import HashTable, _key_bytes, make_seeded_hash
+
+
+_MAGIC = b"DHT1"
+_VERSION = 2
+_HEADER = struct.Struct("<4sIQQQ16s")
+_RECORD = struct.Struct("<II")
+
+
+def _decode_key(data):
+    """Invert hash_table._key_bytes."""
+    tag, body = bytes(data[:1]), bytes(data[1:])
+    if tag == b"b":
+        return body
+    if tag == b"s":
+        return body.decode("utf-8", "surrogatepass")
+    if tag == b"i":
+        return int(body)
+    if tag == b"f":
+        return float.fromhex(body.decode("ascii"))
+    if tag == b"n":
+        return None
+    if tag == b"t":
+        items = []
+        pos = 0
+        while pos < len(body):
+            size = int.from_bytes(body[pos:pos + 4], "little")
+            items.append(_decode_key(body[pos + 4:pos + 4 + size]))
+            pos += 4 + size
+        return tuple(items)
+    raise ValueError(f"Unknown key tag {tag!r}")
+
+
+class DiskHashTable:
+    """Read-only hash table backed by a memory-mapped file."""
+    
+    def __init__(self, path, seed=None):
+        """
+        Open a table written by DiskHashTable.build().
+        
+        Args:
+            path: File to open
+            seed: Expected hash seed (default: the seed stored in the file)
+        
+        Raises:
+            ValueError: If the file is not a valid table or was built with
+                a different seed
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = None
+        try:
+            file_size = os.fstat(self._file.fileno()).st_size
+            if file_size < _HEADER.size:
+                raise ValueError(f"'{path}' is too short for a disk hash table")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            
+            (magic, version, count, num_slots, slots_offset,
+             seed_bytes) = _HEADER.unpack_from(self._map)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"'{path}' is not a version {_VERSION} disk hash table")
+            if num_slots == 0 or slots_offset + 16 * num_slots > file_size:
+                raise ValueError(f"'{path}' is truncated")
+            file_seed = int.from_bytes(seed_bytes, "little", signed=True)
+            if seed is not None and seed != file_seed:
+                raise ValueError(f"'{path}' was built with seed {file_seed}, not {seed}")
+        except BaseException:
+            self.close()
+            raise
+        
+        self.seed = file_seed
+        self._hash = make_seeded_hash(file_seed)
+        self.size = count
+        self.num_slots = num_slots
+        self._view = memoryview(self._map)
+        self._slots = self._view[slots_offset:slots_offset + 16 * num_slots].cast("Q")
+    
+    @classmethod
+    def build(cls, path, source, seed=0):
+        """
+        Write a table file from key-value pairs and open it.
+        
+        Records are streamed to disk as they arrive; only the 16-byte
+        (hash, offset) pair per key is kept in memory. If a key repeats, the
+        last value wins. The file is written under a temporary name and
+        renamed, so readers never see a partial table.
+        
+        Args:
+            path: Destination file
+            source: HashTable, dict, or iterable of (key, value) pairs
+            seed: Hash seed, stored in the file for readers
+        
+        Returns:
+            DiskHashTable opened on the new file
+        """
+        if hasattr(source, "items"):
+            source = source.items()
+        hash_key = make_seeded_hash(seed)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        
+        try:
+            with os.fdopen(fd, "w+b") as out:
+                entries = bytearray()
+                offset = _HEADER.size
+                out.write(b"\0" * offset)
+                
+                for key, value in source:
+                    # Raises TypeError for key types without a stable encoding
+                    key_data = _key_bytes(key)
+                    value_data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                    out.write(_RECORD.pack(len(key_data), len(value_data)))
+                    out.write(key_data)
+                    out.write(value_data)
+                    entries += struct.pack("<QQ", hash_key(key), offset)
+                    offset += _RECORD.size + len(key_data) + len(value_data)
+                
+                out.flush()
+                slots, count = cls._build_slots(out, memoryview(entries).cast("Q"))
+                
+                # Align the slot table so it can be cast to u64 in place
+                padding = -offset % 8
+                out.write(b"\0" * padding)
+                slots_offset = offset + padding
+                out.write(slots)
+                out.seek(0)
+                out.write(_HEADER.pack(_MAGIC, _VERSION, count, len(slots) // 16,
+                                       slots_offset,
+                                       seed.to_bytes(16, "little", signed=True)))
+            
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        
+        return cls(path, seed)
+    
+    @staticmethod
+    def _build_slots(records_file, entries):
+        """
+        Place (hash, offset) pairs into a linear-probing slot table.
+        
+        Returns:
+            Tuple (slot table bytes, number of distinct keys)
+        """
+        num_entries = len(entries) // 2
+        num_slots = max(2 * num_entries, 1)
+        slots = memoryview(bytearray(16 * num_slots)).cast("Q")
+        count = 0
+        
+        def read_key(offset):
+            records_file.seek(offset)
+            key_len, _ = _RECORD.unpack(records_file.read(_RECORD.size))
+            return records_file.read(key_len)
+        
+        for i in range(num_entries):
+            h, offset = entries[2 * i], entries[2 * i + 1]
+            slot = h % num_slots
+            while slots[2 * slot + 1]:
+                # Equal 64-bit hashes almost always mean a repeated key
+                if (slots[2 * slot] == h
+                        and read_key(slots[2 * slot + 1]) == read_key(offset)):
+                    break
+                slot = (slot + 1) % num_slots
+            else:
+                count += 1
+            slots[2 * slot] = h
+            slots[2 * slot + 1] = offset
+        
+        records_file.seek(0, os.SEEK_END)
+        return slots.tobytes(), count
+    
+    def _find(self, key):
+        """Return the record offset for key, or 0 if it is absent."""
+        try:
+            key_data = _key_bytes(key)
+        except TypeError:
+            # Such a key cannot have been stored
+            return 0
+        h = self._hash(key)
+        slots = self._slots
+        num_slots = self.num_slots
+        slot = h % num_slots
+        
+        while True:
+            offset = slots[2 * slot + 1]
+            if offset == 0:
+                return 0
+            if slots[2 * slot] == h:
+                key_len, _ = _RECORD.unpack_from(self._map, offset)
+                start = offset + _RECORD.size
+                if (key_len == len(key_data)
+                        and self._view[start:start + key_len] == key_data):
+                    return offset
+            slot = (slot + 1) % num_slots
+    
+    def _record(self, offset):
+        """Return (key bytes view, value bytes view) stored at offset."""
+        key_len, value_len = _RECORD.unpack_from(self._map, offset)
+        start = offset + _RECORD.size
+        return (self._view[start:start + key_len],
+                self._view[start + key_len:start + key_len + value_len])
+    
+    def get(self, key):
+        """Get value for a key."""
+        offset = self._find(key)
+        if offset == 0:
+            raise KeyError(f"Key '{key}' not found")
+        return pickle.loads(self._record(offset)[1])
+    
+    def contains(self, key):
+        """Check if key exists."""
+        return self._find(key) != 0
+    
+    def items(self):
+        """Yield all (key, value) pairs in slot order."""
+        slots = self._slots
+        for slot in range(self.num_slots):
+            offset = slots[2 * slot + 1]
+            if offset:
+                key_data, value_data = self._record(offset)
+                yield _decode_key(key_data), pickle.loads(value_data)
+    
+    def keys(self):
+        """Yield all keys."""
+        for key, _ in self.items():
+            yield key
+    
+    def close(self):
+        """Unmap and close the file."""
+        for attribute in ("_slots", "_view"):
+            view = getattr(self, attribute, None)
+            if view is not None:
+                view.release()
+                setattr(self, attribute, None)
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        """Return number of key-value pairs."""
+        return self.size
+
+
+def benchmark(n=200_000, path=None):
+    """
+    Compare rebuilding a HashTable with building and reopening a disk table.
+    
+    Args:
+        n: Number of key-value pairs
+        path: Table file (default: a temporary file, removed afterwards)
+    """
+    pairs = [(f"url:/page/{i}", {"id": i, "rank": i % 100}) for i in range(n)]
+    keys = [key for key, _ in pairs]
+    cleanup = path is None
+    if cleanup:
+        fd, path = tempfile.mkstemp(suffix=".dht")
+        os.close(fd)
+    
+    start = time.perf_counter()
+    table = HashTable.from_items(pairs)
+    rebuild = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    DiskHashTable.build(path, table).close()
+    build = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    disk = DiskHashTable(path)
+    open_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for key in keys:
+        disk.get(key)
+    lookups = n / (time.perf_counter() - start)
+    disk.close()
+    
+    print(f"  {n:,} pairs, file size {os.path.getsize(path) / 1e6:.1f} MB")
+    print(f"  Rebuild HashTable in memory: {rebuild * 1000:>9.1f} ms")
+    print(f"  Build disk table (one-off):  {build * 1000:>9.1f} ms")
+    print(f"  Open disk table:             {open_time * 1000:>9.3f} ms")
+    print(f"  Disk table lookups:          {lookups:>9,.0f} /s")
+    
+    if cleanup:
+        os.unlink(path)
+
+
+# Example usage
+if __name__ == "__main__":
+    ht = HashTable()
+    ht.insert("apple", 5)
+    ht.insert("banana", [3, 4])
+    ht.insert(42, {"answer": True})
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "fruits.dht")
+        
+        print("Building disk table from a HashTable:")
+        DiskHashTable.build(path, ht).close()
+        print(f"  Wrote {os.path.getsize(path)} bytes to {os.path.basename(path)}")
+        
+        print("\nReopening with mmap:")
+        with DiskHashTable(path) as disk:
+            print(f"  Size: {len(disk)}")
+            print(f"  apple: {disk.get('apple')}")
+            print(f"  banana: {disk.get('banana')}")
+            print(f"  42: {disk.get(42)}")
+            print(f"  Contains 'cherry': {disk.contains('cherry')}")
+            print(f"  Items: {dict(disk.items())}")
+    
+    print("\nBenchmark (rebuild vs reopen):")
+    benchmark()
@@ -11,6 +11,9 @@ Time Complexity:
     - Search: O(n)
 
 Space Complexity: O(n)
+
+append() and prepend() return the new node. Keeping that node as a handle
+allows O(1) remove_node() and move_to_end(), which is what LRU caches need.
 """
 
 
@@ -36,10 +39,15 @@ class DoublyLinkedList:
         return self.head is None
     
     def append(self, data):
-        """Add element at the end of the list."""
-        new_node = Node(data)
+        """Add element at the end of the list and return its node."""
+        return self.append_node(Node(data))
+    
+    def append_node(self, new_node):
+        """Link an existing (unlinked) node at the end of the list."""
+        new_node.next = None
         
         if self.head is None:
+            new_node.prev = None
             self.head = self.tail = new_node
         else:
             new_node.prev = self.tail
@@ -47,9 +55,10 @@ class DoublyLinkedList:
             self.tail = new_node
         
         self.size += 1
+        return new_node
     
     def prepend(self, data):
-        """Add element at the beginning of the list."""
+        """Add element at the beginning of the list and return its node."""
         new_node = Node(data)
         
         if self.head is None:
@@ -60,6 +69,50 @@ class DoublyLinkedList:
             self.head = new_node
         
         self.size += 1
+        return new_node
+    
+    def insert_after(self, node, data):
+        """Add element right after a node of this list and return its node."""
+        new_node = Node(data)
+        new_node.prev = node
+        new_node.next = node.next
+        
+        if node.next:
+            node.next.prev = new_node
+        else:
+            self.tail = new_node
+        node.next = new_node
+        
+        self.size += 1
+        return new_node
+    
+    def remove_node(self, node):
+        """Unlink a node of this list in O(1) and return its data."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        
+        node.prev = node.next = None
+        self.size -= 1
+        return node.data
+    
+    def move_to_end(self, node):
+        """Move a node of this list to the tail in O(1)."""
+        if node is not self.tail:
+            self.remove_node(node)
+            self.append_node(node)
+    
+    def pop_front(self):
+        """Remove and return the data at the head."""
+        if self.head is None:
+            raise IndexError("pop from empty list")
+        return self.remove_node(self.head)
     
     def delete(self, data):
         """Delete first occurrence of data."""
@@ -67,17 +120,7 @@ class DoublyLinkedList:
         
         while current:
             if current.data == data:
-                if current.prev:
-                    current.prev.next = current.next
-                else:
-                    self.head = current.next
-                
-                if current.next:
-                    current.next.prev = current.prev
-                else:
-                    self.tail = current.prev
-                
-                self.size -= 1
+                self.remove_node(current)
                 return True
             
             current = current.next
@@ -13,44 +13,204 @@ Time Complexity (worst case): O(n) - when all keys hash to same bucket
 
 Space Complexity: O(n)
 
-Note: Uses chaining to handle collisions.
+Two storage engines are available, selected with HashTable(engine=...):
+    - "chaining": a list of buckets, each a list of (hash, key, value) tuples.
+    - "compact": open addressing over a small index array that points into
+      dense parallel key/value/hash lists, like CPython's dict layout.
+      Iteration follows insertion order and lookups avoid chasing buckets.
+
+Keys are hashed with the built-in hash() unless a hash_function is given;
+make_seeded_hash() builds a keyed hash that is stable across processes. Each
+entry keeps its full hash, so resizing never rehashes keys and comparisons
+check the hash before calling __eq__. collision_stats() reports chain and
+probe lengths for spotting pathological key distributions.
+
+Resizing doubles the table when the load factor passes 0.7. With
+incremental=True (chaining engine) the old buckets are kept alongside the
+new ones and migrated a few at a time on each operation, as in Redis, so no
+single insert pays for a full rehash. reserve(n) and from_items() presize
+the table so that loading a known number of entries never resizes.
+
+insert_many(), get_many(), delete_many() and update() handle many keys per
+call: the table is sized once and the inner loop avoids per-item method
+dispatch and load-factor checks.
 """
 
 
+import gc
+import hashlib
+import time
+import tracemalloc
+
+
+def _key_bytes(key):
+    """
+    Encode a key as bytes, tagged by type so that 1 and "1" differ.
+    
+    Keys that compare equal get equal encodings: True, 1 and 1.0 all encode
+    as the int 1, and tuples are encoded element by element.
+    
+    Raises:
+        TypeError: If the key is not bytes, str, a real number, None or a
+            tuple of those, since other types have no canonical byte form
+    """
+    if isinstance(key, bytes):
+        return b"b" + key
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8", "surrogatepass")
+    if isinstance(key, float):
+        if not key.is_integer():
+            return b"f" + key.hex().encode("ascii")
+        key = int(key)
+    if isinstance(key, int):
+        return b"i" + str(int(key)).encode("ascii")
+    if key is None:
+        return b"n"
+    if isinstance(key, tuple):
+        parts = [_key_bytes(item) for item in key]
+        return b"t" + b"".join(len(part).to_bytes(4, "little") + part for part in parts)
+    raise TypeError(f"Cannot hash key of type {type(key).__name__} stably")
+
+
+def make_seeded_hash(seed=0):
+    """
+    Build a keyed 64-bit hash function (BLAKE2b with the seed as its key).
+    
+    Unlike the built-in hash(), whose string hashing is randomized per process,
+    the result depends only on the seed and the key, so it can be stored on disk
+    or shared between processes. Keys must be str, bytes, int, float, None or
+    tuples of those; equal keys such as 1, 1.0 and True hash the same.
+    
+    Args:
+        seed: Integer seed; different seeds give independent hash functions
+    
+    Returns:
+        Function mapping a key to a non-negative 64-bit int
+    """
+    secret = seed.to_bytes(16, "little", signed=True)
+    
+    def seeded_hash(key):
+        digest = hashlib.blake2b(_key_bytes(key), digest_size=8, key=secret)
+        return int.from_bytes(digest.digest(), "little")
+    
+    return seeded_hash
+
+
+def _as_sequence(items):
+    """Materialize an iterable so its length is known before loading it."""
+    return items if hasattr(items, "__len__") else list(items)
+
+
+def _append(buckets, index, entry):
+    """Append an entry to a chained bucket, creating the bucket if empty."""
+    bucket = buckets[index]
+    if bucket:
+        bucket.append(entry)
+    else:
+        buckets[index] = [entry]
+
+
 class HashTable:
     """Hash table implementation using chaining for collision resolution."""
     
-    def __init__(self, capacity=10):
+    # Old buckets migrated per operation while an incremental resize runs
+    rehash_step = 4
+    
+    def __new__(cls, capacity=10, engine="chaining", **kwargs):
+        """Dispatch HashTable(engine="compact") to the compact engine."""
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', "
+                             f"expected one of {sorted(ENGINES)}")
+        if cls is HashTable:
+            cls = ENGINES[engine]
+        return super().__new__(cls)
+    
+    def __init__(self, capacity=10, engine="chaining", hash_function=None,
+                 incremental=False):
         """
         Initialize hash table.
         
         Args:
             capacity: Initial capacity of the hash table
+            engine: Storage engine, "chaining" (default) or "compact"
+            hash_function: Callable mapping a key to an int (default: hash)
+            incremental: Spread each resize over later operations instead of
+                rehashing everything at once (bounded per-operation latency)
         """
+        self.engine = engine
+        self.hash_function = hash_function or hash
+        self.incremental = incremental
         self.capacity = capacity
         self.size = 0
-        self.buckets = [[] for _ in range(capacity)]
+        # Each bucket holds (hash, key, value) triples; empty buckets share ()
+        self.buckets = [()] * capacity
+        # Buckets still being drained by an incremental resize
+        self._old_buckets = None
+        self._old_capacity = 0
+        self._rehash_index = 0
+    
+    @classmethod
+    def from_items(cls, items, size_hint=None, **kwargs):
+        """
+        Build a table from (key, value) pairs, sized up front.
+        
+        Args:
+            items: Iterable of (key, value) pairs
+            size_hint: Expected number of pairs (default: len(items) if known)
+            **kwargs: Passed to the constructor (engine, hash_function, ...)
+        
+        Returns:
+            New table that performed no resizes while loading
+        """
+        if size_hint is None and hasattr(items, "__len__"):
+            size_hint = len(items)
+        table = cls(**kwargs)
+        if size_hint:
+            table.reserve(size_hint)
+        for key, value in items:
+            table.insert(key, value)
+        return table
     
     def _hash(self, key):
-        """Compute hash value for a key."""
-        if isinstance(key, int):
-            return key % self.capacity
-        # For string keys, use sum of character codes
-        return sum(ord(c) for c in str(key)) % self.capacity
+        """Compute the full hash value for a key."""
+        return self.hash_function(key)
+    
+    def _locate(self, h, key):
+        """
+        Find the entry for a key.
+        
+        Returns:
+            Tuple (buckets, index, i) with the key at buckets[index][i], or
+            i == -1 and buckets[index] the bucket a new key belongs in
+        """
+        index = h % self.capacity
+        for i, (kh, k, _) in enumerate(self.buckets[index]):
+            if kh == h and k == key:
+                return self.buckets, index, i
+        
+        # Keys not yet migrated still live in the old table
+        if self._old_buckets is not None:
+            old_index = h % self._old_capacity
+            for i, (kh, k, _) in enumerate(self._old_buckets[old_index]):
+                if kh == h and k == key:
+                    return self._old_buckets, old_index, i
+        
+        return self.buckets, index, -1
     
     def insert(self, key, value):
         """Insert or update key-value pair."""
-        index = self._hash(key)
-        bucket = self.buckets[index]
+        h = self._hash(key)
+        if self._old_buckets is not None:
+            self._rehash_step()
+        buckets, index, i = self._locate(h, key)
         
-        # Check if key already exists
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)
-                return
+        # Update in place if the key already exists
+        if i >= 0:
+            buckets[index][i] = (h, key, value)
+            return
         
         # Add new key-value pair
-        bucket.append((key, value))
+        _append(buckets, index, (h, key, value))
         self.size += 1
         
         # Resize if load factor > 0.7
@@ -59,27 +219,27 @@ class HashTable:
     
     def get(self, key):
         """Get value for a key."""
-        index = self._hash(key)
-        bucket = self.buckets[index]
-        
-        for k, v in bucket:
-            if k == key:
-                return v
+        h = self._hash(key)
+        if self._old_buckets is not None:
+            self._rehash_step()
+        buckets, index, i = self._locate(h, key)
         
-        raise KeyError(f"Key '{key}' not found")
+        if i < 0:
+            raise KeyError(f"Key '{key}' not found")
+        return buckets[index][i][2]
     
     def delete(self, key):
         """Delete key-value pair."""
-        index = self._hash(key)
-        bucket = self.buckets[index]
+        h = self._hash(key)
+        if self._old_buckets is not None:
+            self._rehash_step()
+        buckets, index, i = self._locate(h, key)
         
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket.pop(i)
-                self.size -= 1
-                return True
-        
-        return False
+        if i < 0:
+            return False
+        buckets[index].pop(i)
+        self.size -= 1
+        return True
     
     def contains(self, key):
         """Check if key exists."""
@@ -89,17 +249,240 @@ class HashTable:
         except KeyError:
             return False
     
+    def insert_many(self, pairs):
+        """
+        Insert or update many key-value pairs at once.
+        
+        The table is grown once up front, and the loop skips per-call method
+        dispatch and load-factor checks.
+        
+        Args:
+            pairs: Iterable of (key, value) pairs
+        """
+        pairs = _as_sequence(pairs)
+        self.reserve(self.size + len(pairs))
+        if self._old_buckets is not None:
+            self._finish_rehash()
+        
+        hash_function = self.hash_function
+        buckets = self.buckets
+        capacity = self.capacity
+        added = 0
+        
+        for key, value in pairs:
+            h = hash_function(key)
+            index = h % capacity
+            bucket = buckets[index]
+            if not bucket:
+                buckets[index] = [(h, key, value)]
+                added += 1
+                continue
+            for i, (kh, k, _) in enumerate(bucket):
+                if kh == h and k == key:
+                    bucket[i] = (h, key, value)
+                    break
+            else:
+                bucket.append((h, key, value))
+                added += 1
+        
+        self.size += added
+    
+    def get_many(self, keys, default=None):
+        """
+        Look up many keys at once.
+        
+        Args:
+            keys: Iterable of keys
+            default: Value returned for missing keys
+        
+        Returns:
+            List of values in the order of keys
+        """
+        if self._old_buckets is not None:
+            self._finish_rehash()
+        
+        hash_function = self.hash_function
+        buckets = self.buckets
+        capacity = self.capacity
+        result = []
+        
+        for key in keys:
+            h = hash_function(key)
+            for kh, k, v in buckets[h % capacity]:
+                if kh == h and k == key:
+                    result.append(v)
+                    break
+            else:
+                result.append(default)
+        
+        return result
+    
+    def delete_many(self, keys):
+        """
+        Delete many keys at once.
+        
+        Args:
+            keys: Iterable of keys
+        
+        Returns:
+            Number of keys that were present and deleted
+        """
+        if self._old_buckets is not None:
+            self._finish_rehash()
+        
+        hash_function = self.hash_function
+        buckets = self.buckets
+        capacity = self.capacity
+        removed = 0
+        
+        for key in keys:
+            h = hash_function(key)
+            bucket = buckets[h % capacity]
+            for i, (kh, k, _) in enumerate(bucket):
+                if kh == h and k == key:
+                    bucket.pop(i)
+                    removed += 1
+                    break
+        
+        self.size -= removed
+        return removed
+    
+    def update(self, other):
+        """
+        Insert every pair from a mapping or an iterable of pairs.
+        
+        Args:
+            other: HashTable, dict, or iterable of (key, value) pairs
+        """
+        if hasattr(other, "items"):
+            other = other.items()
+        self.insert_many(other)
+    
+    def reserve(self, n):
+        """
+        Grow the table so that n entries fit without any further resize.
+        
+        Args:
+            n: Total number of entries expected
+        """
+        capacity = int(n / 0.7) + 1
+        if capacity > self.capacity:
+            self._rebuild(capacity)
+    
     def _resize(self):
         """Resize hash table when load factor is too high."""
-        old_buckets = self.buckets
+        if not self.incremental:
+            self._rebuild(self.capacity * 2)
+            return
+        
+        # Only one migration at a time; finish it before starting the next
+        if self._old_buckets is not None:
+            self._finish_rehash()
+        self._old_buckets = self.buckets
+        self._old_capacity = self.capacity
+        self._rehash_index = 0
         self.capacity *= 2
-        self.buckets = [[] for _ in range(self.capacity)]
-        self.size = 0
+        self.buckets = [()] * self.capacity
+    
+    def _rebuild(self, capacity):
+        """Redistribute every entry into capacity buckets at once."""
+        if self._old_buckets is not None:
+            self._finish_rehash()
+        old_buckets = self.buckets
+        self.capacity = capacity
+        self.buckets = [()] * capacity
         
-        # Rehash all elements
+        # Redistribute entries using their stored hashes
+        buckets = self.buckets
         for bucket in old_buckets:
-            for key, value in bucket:
-                self.insert(key, value)
+            for entry in bucket:
+                _append(buckets, entry[0] % capacity, entry)
+    
+    def _rehash_step(self, steps=None):
+        """Move up to `steps` non-empty old buckets into the new table."""
+        old_buckets = self._old_buckets
+        buckets = self.buckets
+        capacity = self.capacity
+        steps = steps or self.rehash_step
+        # Like Redis, bound the number of empty buckets visited as well
+        visits = steps * 10
+        i = self._rehash_index
+        
+        while i < self._old_capacity and steps > 0 and visits > 0:
+            bucket = old_buckets[i]
+            if bucket:
+                for entry in bucket:
+                    _append(buckets, entry[0] % capacity, entry)
+                old_buckets[i] = ()
+                steps -= 1
+            i += 1
+            visits -= 1
+        
+        self._rehash_index = i
+        if i >= self._old_capacity:
+            self._old_buckets = None
+            self._old_capacity = 0
+    
+    def _finish_rehash(self):
+        """Complete a pending incremental resize."""
+        while self._old_buckets is not None:
+            self._rehash_step(self._old_capacity)
+    
+    def _all_buckets(self):
+        """Yield buckets of the current table and of any pending migration."""
+        yield from self.buckets
+        if self._old_buckets is not None:
+            yield from self._old_buckets[self._rehash_index:]
+    
+    def _probe_lengths(self):
+        """Yield the number of comparisons needed to find each entry."""
+        for bucket in self._all_buckets():
+            yield from range(1, len(bucket) + 1)
+    
+    def collision_stats(self):
+        """
+        Summarize how well keys are spread over the table.
+        
+        A probe length is the number of entries compared to find a key: its
+        position in the chain, or the number of slots visited when probing.
+        
+        Returns:
+            Dictionary with size, capacity, load_factor, max_chain_length,
+            mean_probe_length and probe_length_histogram {length: count}
+        """
+        histogram = {}
+        for length in self._probe_lengths():
+            histogram[length] = histogram.get(length, 0) + 1
+        
+        total = sum(length * count for length, count in histogram.items())
+        return {
+            "size": self.size,
+            "capacity": self.capacity,
+            "load_factor": self.size / self.capacity,
+            "max_chain_length": max(histogram, default=0),
+            "mean_probe_length": total / self.size if self.size else 0.0,
+            "probe_length_histogram": dict(sorted(histogram.items())),
+        }
+    
+    def items(self):
+        """Yield all (key, value) pairs."""
+        for bucket in self._all_buckets():
+            for _, key, value in bucket:
+                yield key, value
+    
+    def keys(self):
+        """Yield all keys."""
+        for key, _ in self.items():
+            yield key
+    
+    def values(self):
+        """Yield all values."""
+        for _, value in self.items():
+            yield value
+    
+    def __iter__(self):
+        """Iterate over keys."""
+        return self.keys()
     
     def __len__(self):
         """Return number of key-value pairs."""
@@ -107,13 +490,407 @@ class HashTable:
     
     def __str__(self):
         """String representation."""
-        items = []
-        for bucket in self.buckets:
-            for key, value in bucket:
-                items.append(f"{key}: {value}")
+        items = [f"{key}: {value}" for key, value in self.items()]
         return "{" + ", ".join(items) + "}"
 
 
+# Index slot markers for the compact engine
+_EMPTY = -1
+_DUMMY = -2
+
+# Marker left in the dense key list when an entry is deleted
+_DELETED = object()
+
+_PERTURB_MASK = (1 << 64) - 1
+
+
+def _index_format(capacity):
+    """Pick the narrowest signed integer type that can index the entries."""
+    if capacity <= 0x7F:
+        return "b", 1
+    if capacity <= 0x7FFF:
+        return "h", 2
+    if capacity <= 0x7FFFFFFF:
+        return "i", 4
+    return "q", 8
+
+
+class CompactHashTable(HashTable):
+    """
+    Hash table using open addressing with a compact, CPython-style layout.
+    
+    The sparse part is an index array of 1/2/4/8-byte integers (sized to the
+    table) holding positions into three dense lists: keys, values and hashes.
+    Entries are appended to the dense lists, so iteration is in insertion order
+    and touches no empty slots. Deleted entries leave a _DELETED marker that is
+    dropped on the next resize.
+    
+    A resize only rebuilds the index array from the stored hashes, but dense
+    entry positions shift when deleted entries are compacted away, so this
+    engine does not support incremental resizing; use reserve() instead.
+    """
+    
+    def __init__(self, capacity=10, engine="compact", hash_function=None,
+                 incremental=False):
+        """
+        Initialize hash table.
+        
+        Args:
+            capacity: Initial capacity (rounded up to a power of two, minimum 8)
+            engine: Always "compact"; accepted for HashTable compatibility
+            hash_function: Callable mapping a key to an int (default: hash)
+            incremental: Must be False; see the class docstring
+        """
+        if incremental:
+            raise ValueError("Incremental resizing requires the chaining engine")
+        self.engine = "compact"
+        self.hash_function = hash_function or hash
+        self.incremental = False
+        self.size = 0
+        self._keys = []
+        self._values = []
+        self._hashes = []
+        self._allocate_indices(max(capacity, 8))
+    
+    def _allocate_indices(self, capacity):
+        """Create an empty index array with a power-of-two number of slots."""
+        size = 8
+        while size < capacity:
+            size <<= 1
+        self.capacity = size
+        # Keep at least one empty slot so probing always terminates
+        self._usable = size * 2 // 3
+        fmt, width = _index_format(size)
+        self._indices = memoryview(bytearray(b"\xff" * (size * width))).cast(fmt)
+    
+    def _lookup(self, key, h):
+        """
+        Probe for a key.
+        
+        Returns:
+            Tuple (slot, entry) where entry is the dense index of the key, or -1
+            if missing. When missing, slot is where the key should be placed.
+        """
+        indices = self._indices
+        keys = self._keys
+        hashes = self._hashes
+        mask = self.capacity - 1
+        perturb = h & _PERTURB_MASK
+        slot = h & mask
+        free_slot = -1
+        
+        while True:
+            entry = indices[slot]
+            if entry == _EMPTY:
+                return (slot if free_slot < 0 else free_slot), -1
+            if entry == _DUMMY:
+                if free_slot < 0:
+                    free_slot = slot
+            elif hashes[entry] == h:
+                k = keys[entry]
+                if k is key or k == key:
+                    return slot, entry
+            perturb >>= 5
+            slot = (slot * 5 + perturb + 1) & mask
+    
+    def insert(self, key, value):
+        """Insert or update key-value pair."""
+        h = self._hash(key)
+        slot, entry = self._lookup(key, h)
+        
+        if entry >= 0:
+            self._values[entry] = value
+            return
+        
+        # Dense lists only grow until the next resize compacts them
+        if len(self._keys) >= self._usable:
+            self._resize()
+            slot, _ = self._lookup(key, h)
+        
+        self._indices[slot] = len(self._keys)
+        self._keys.append(key)
+        self._values.append(value)
+        self._hashes.append(h)
+        self.size += 1
+    
+    def get(self, key):
+        """Get value for a key."""
+        _, entry = self._lookup(key, self._hash(key))
+        if entry < 0:
+            raise KeyError(f"Key '{key}' not found")
+        return self._values[entry]
+    
+    def delete(self, key):
+        """Delete key-value pair."""
+        slot, entry = self._lookup(key, self._hash(key))
+        if entry < 0:
+            return False
+        
+        self._indices[slot] = _DUMMY
+        self._keys[entry] = _DELETED
+        self._values[entry] = None
+        self.size -= 1
+        return True
+    
+    def insert_many(self, pairs):
+        """
+        Insert or update many key-value pairs at once.
+        
+        After a single reserve() no insert can trigger a resize, so the loop
+        skips the per-insert load check.
+        
+        Args:
+            pairs: Iterable of (key, value) pairs
+        """
+        pairs = _as_sequence(pairs)
+        self.reserve(self.size + len(pairs))
+        
+        hash_function = self.hash_function
+        lookup = self._lookup
+        indices = self._indices
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        
+        for key, value in pairs:
+            h = hash_function(key)
+            slot, entry = lookup(key, h)
+            if entry >= 0:
+                values[entry] = value
+            else:
+                indices[slot] = len(keys)
+                keys.append(key)
+                values.append(value)
+                hashes.append(h)
+                self.size += 1
+    
+    def get_many(self, keys, default=None):
+        """
+        Look up many keys at once.
+        
+        Args:
+            keys: Iterable of keys
+            default: Value returned for missing keys
+        
+        Returns:
+            List of values in the order of keys
+        """
+        hash_function = self.hash_function
+        lookup = self._lookup
+        values = self._values
+        result = []
+        
+        for key in keys:
+            entry = lookup(key, hash_function(key))[1]
+            result.append(values[entry] if entry >= 0 else default)
+        
+        return result
+    
+    def delete_many(self, keys):
+        """
+        Delete many keys at once.
+        
+        Args:
+            keys: Iterable of keys
+        
+        Returns:
+            Number of keys that were present and deleted
+        """
+        hash_function = self.hash_function
+        lookup = self._lookup
+        indices = self._indices
+        removed = 0
+        
+        for key in keys:
+            slot, entry = lookup(key, hash_function(key))
+            if entry >= 0:
+                indices[slot] = _DUMMY
+                self._keys[entry] = _DELETED
+                self._values[entry] = None
+                removed += 1
+        
+        self.size -= removed
+        return removed
+    
+    def reserve(self, n):
+        """
+        Grow the table so that n entries fit without any further resize.
+        
+        Args:
+            n: Total number of entries expected
+        """
+        if n > self._usable - (len(self._keys) - self.size):
+            self._resize(n * 3 // 2 + 1)
+    
+    def _resize(self, capacity=None):
+        """
+        Drop deleted entries and rebuild the index array.
+        
+        Args:
+            capacity: Minimum number of index slots (default: 3x live entries,
+                the same growth policy as CPython)
+        """
+        live = [i for i, k in enumerate(self._keys) if k is not _DELETED]
+        self._keys = [self._keys[i] for i in live]
+        self._values = [self._values[i] for i in live]
+        self._hashes = [self._hashes[i] for i in live]
+        
+        self._allocate_indices(max(capacity or self.size * 3, 8))
+        
+        indices = self._indices
+        mask = self.capacity - 1
+        for entry, h in enumerate(self._hashes):
+            perturb = h & _PERTURB_MASK
+            slot = h & mask
+            while indices[slot] != _EMPTY:
+                perturb >>= 5
+                slot = (slot * 5 + perturb + 1) & mask
+            indices[slot] = entry
+    
+    def _probe_lengths(self):
+        """Yield the number of index slots visited to find each entry."""
+        indices = self._indices
+        mask = self.capacity - 1
+        for entry, h in enumerate(self._hashes):
+            if self._keys[entry] is _DELETED:
+                continue
+            perturb = h & _PERTURB_MASK
+            slot = h & mask
+            probes = 1
+            while indices[slot] != entry:
+                perturb >>= 5
+                slot = (slot * 5 + perturb + 1) & mask
+                probes += 1
+            yield probes
+    
+    def items(self):
+        """Yield all (key, value) pairs in insertion order."""
+        for key, value in zip(self._keys, self._values):
+            if key is not _DELETED:
+                yield key, value
+
+
+ENGINES = {
+    "chaining": HashTable,
+    "compact": CompactHashTable,
+}
+
+
+def _measure_build(engine, keys):
+    """Return bytes allocated per entry while building a table."""
+    tracemalloc.start()
+    table = HashTable(engine=engine)
+    for key in keys:
+        table.insert(key, key)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(keys)
+
+
+def benchmark(sizes=(10_000, 100_000)):
+    """
+    Compare memory per entry and insert/get throughput of both engines.
+    
+    Larger sizes (up to 1e7) work but take minutes in pure Python.
+    
+    Args:
+        sizes: Key counts to benchmark
+    """
+    print(f"{'engine':>9} {'keys':>10} {'bytes/entry':>12} "
+          f"{'insert/s':>12} {'get/s':>12}")
+    for n in sizes:
+        keys = [f"user:{i}" for i in range(n)]
+        for engine in ENGINES:
+            per_entry = _measure_build(engine, keys)
+            
+            table = HashTable(engine=engine)
+            start = time.perf_counter()
+            for key in keys:
+                table.insert(key, key)
+            insert_rate = n / (time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            for key in keys:
+                table.get(key)
+            get_rate = n / (time.perf_counter() - start)
+            
+            print(f"{engine:>9} {n:>10,} {per_entry:>12.1f} "
+                  f"{insert_rate:>12,.0f} {get_rate:>12,.0f}")
+
+
+def benchmark_resize(n=200_000):
+    """
+    Compare the worst single-insert latency of eager, incremental and
+    presized (reserve) loading. The garbage collector is paused while timing
+    so that its pauses are not mistaken for resize stalls.
+    
+    Args:
+        n: Number of keys to insert
+    """
+    keys = [f"user:{i}" for i in range(n)]
+    setups = [
+        ("eager", lambda: HashTable()),
+        ("incremental", lambda: HashTable(incremental=True)),
+        ("reserve(n)", lambda: HashTable.from_items([], size_hint=n)),
+    ]
+    
+    print(f"{'mode':>12} {'total s':>9} {'worst insert ms':>16} {'resizes':>8}")
+    for name, make_table in setups:
+        gc.collect()
+        gc.disable()
+        table = make_table()
+        resizes = 0
+        capacity = table.capacity
+        worst = 0.0
+        start = time.perf_counter()
+        for key in keys:
+            t0 = time.perf_counter()
+            table.insert(key, key)
+            worst = max(worst, time.perf_counter() - t0)
+            if table.capacity != capacity:
+                capacity = table.capacity
+                resizes += 1
+        total = time.perf_counter() - start
+        gc.enable()
+        print(f"{name:>12} {total:>9.2f} {worst * 1000:>16.2f} {resizes:>8}")
+
+
+def benchmark_batch(n=200_000):
+    """
+    Compare per-item insert/get/delete loops with the batch operations.
+    
+    Args:
+        n: Number of key-value pairs
+    """
+    pairs = [(f"event:{i}", i) for i in range(n)]
+    keys = [key for key, _ in pairs]
+    
+    print(f"{'engine':>9} {'operation':>10} {'loop s':>8} {'batch s':>8} {'speedup':>8}")
+    for engine in ENGINES:
+        looped = HashTable(engine=engine)
+        batched = HashTable(engine=engine)
+        runs = [
+            ("insert",
+             lambda: [looped.insert(k, v) for k, v in pairs],
+             lambda: batched.insert_many(pairs)),
+            ("get",
+             lambda: [looped.get(k) for k in keys],
+             lambda: batched.get_many(keys)),
+            ("delete",
+             lambda: [looped.delete(k) for k in keys],
+             lambda: batched.delete_many(keys)),
+        ]
+        for name, loop, batch in runs:
+            start = time.perf_counter()
+            loop()
+            loop_time = time.perf_counter() - start
+            start = time.perf_counter()
+            batch()
+            batch_time = time.perf_counter() - start
+            print(f"{engine:>9} {name:>10} {loop_time:>8.3f} {batch_time:>8.3f} "
+                  f"{loop_time / batch_time:>7.1f}x")
+
+
 # Example usage
 if __name__ == "__main__":
     ht = HashTable()
@@ -136,4 +913,50 @@ if __name__ == "__main__":
     ht.delete("banana")
     print(f"  {ht}")
     print(f"  Size: {len(ht)}")
-
+    
+    print("\nCompact engine (insertion-ordered):")
+    compact = HashTable(engine="compact")
+    for fruit, count in [("cherry", 8), ("apple", 5), ("banana", 3)]:
+        compact.insert(fruit, count)
+    compact.delete("apple")
+    compact.insert("date", 1)
+    print(f"  {compact}")
+    print(f"  Index slots: {compact.capacity}, "
+          f"index bytes: {compact._indices.nbytes}")
+    
+    print("\nCollision statistics for 2,000 user IDs:")
+    user_ids = [f"user:{i}" for i in range(2000)]
+    hash_functions = [
+        ("sum of char codes", lambda key: sum(ord(c) for c in str(key))),
+        ("built-in hash", None),
+        ("seeded BLAKE2b", make_seeded_hash(42)),
+    ]
+    for name, function in hash_functions:
+        table = HashTable(hash_function=function)
+        for user_id in user_ids:
+            table.insert(user_id, True)
+        stats = table.collision_stats()
+        print(f"  {name:>18}: max chain {stats['max_chain_length']:>4}, "
+              f"mean probes {stats['mean_probe_length']:.2f}")
+    
+    print("\nLoading a snapshot with a known size:")
+    snapshot = [(f"id{i}", i) for i in range(1000)]
+    loaded = HashTable.from_items(snapshot, engine="compact")
+    print(f"  {len(loaded)} entries, capacity {loaded.capacity}")
+    
+    print("\nBatch operations:")
+    batch = HashTable(engine="compact")
+    batch.insert_many([("a", 1), ("b", 2), ("c", 3)])
+    batch.update({"c": 30, "d": 4})
+    print(f"  {batch}")
+    print(f"  get_many(['a', 'x', 'd']): {batch.get_many(['a', 'x', 'd'], default=0)}")
+    print(f"  delete_many(['a', 'b', 'x']): {batch.delete_many(['a', 'b', 'x'])}")
+    
+    print("\nBenchmark (chaining vs compact):")
+    benchmark()
+    
+    print("\nBenchmark (resize latency):")
+    benchmark_resize()
+    
+    print("\nBenchmark (per-item loop vs batch):")
+    benchmark_batch()
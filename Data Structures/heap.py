@@ -13,6 +13,15 @@ Time Complexity:
 
 Space Complexity: O(n)
 
+Heap is the general form: any arity (children per node), an optional key
+function and min or max ordering, built in O(n) by Heap.heapify(). MinHeap
+and MaxHeap are binary instances of it. Wider heaps are shallower, so a sift
+makes fewer hops at the cost of more comparisons per level.
+
+IndexedMinHeap also keeps a map from each item to its slot in the heap, so
+an item's priority can be changed, or the item removed, in O(log n). Graph
+algorithms can then update a vertex in place instead of pushing duplicates.
+
 Applications:
     - Priority queues
     - Heap sort
@@ -20,70 +29,161 @@ Applications:
 """
 
 
-class MinHeap:
-    """Min Heap implementation (parent <= children)."""
+import operator
+import random
+import time
+
+
+class Heap:
+    """
+    d-ary heap with an optional key function, min- or max-ordered.
     
-    def __init__(self):
+    Items live in self.heap. With a key function, keys are computed once per
+    item and kept in a parallel list; otherwise that list is self.heap.
+    """
+    
+    def __init__(self, arity=2, key=None, max_heap=False):
+        """
+        Initialize an empty heap.
+        
+        Args:
+            arity: Children per node (2, 4 and 8 are typical)
+            key: Function mapping an item to the value it is ordered by
+            max_heap: Put the largest key at the root instead of the smallest
+        """
+        if arity < 2:
+            raise ValueError("Arity must be at least 2")
+        self.arity = arity
+        self.key = key
+        self.max_heap = max_heap
         self.heap = []
+        self._keys = [] if key is not None else self.heap
+        # before(a, b): a belongs above b
+        self._before = operator.gt if max_heap else operator.lt
+    
+    @classmethod
+    def heapify(cls, iterable, arity=2, key=None, max_heap=False):
+        """
+        Build a heap from an iterable in O(n).
+        
+        Sifting down every internal node, deepest first, does O(n) work in
+        total, compared with O(n log n) for n separate pushes.
+        
+        Returns:
+            New heap holding the items
+        """
+        heap = cls.__new__(cls)
+        Heap.__init__(heap, arity, key, max_heap)
+        heap.heap.extend(iterable)
+        if key is not None:
+            heap._keys.extend(map(key, heap.heap))
+        for i in range((len(heap.heap) - 2) // arity, -1, -1):
+            heap._sift_down(i)
+        return heap
     
     def parent(self, i):
         """Get parent index."""
-        return (i - 1) // 2
+        return (i - 1) // self.arity
     
     def left_child(self, i):
-        """Get left child index."""
-        return 2 * i + 1
+        """Get first child index."""
+        return self.arity * i + 1
     
     def right_child(self, i):
-        """Get right child index."""
-        return 2 * i + 2
+        """Get second child index."""
+        return self.arity * i + 2
     
     def swap(self, i, j):
         """Swap elements at indices i and j."""
         self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        if self.key is not None:
+            self._keys[i], self._keys[j] = self._keys[j], self._keys[i]
     
-    def insert(self, value):
-        """Insert value into heap."""
-        self.heap.append(value)
-        self._heapify_up(len(self.heap) - 1)
+    def _sift_up(self, i):
+        """Move the item at index i up to its place."""
+        heap, keys, before, arity = self.heap, self._keys, self._before, self.arity
+        item, k = heap[i], keys[i]
+        while i > 0:
+            parent = (i - 1) // arity
+            if not before(k, keys[parent]):
+                break
+            heap[i] = heap[parent]
+            keys[i] = keys[parent]
+            i = parent
+        heap[i] = item
+        keys[i] = k
     
-    def _heapify_up(self, i):
-        """Maintain heap property by moving element up."""
-        while i > 0 and self.heap[self.parent(i)] > self.heap[i]:
-            self.swap(i, self.parent(i))
-            i = self.parent(i)
+    def _sift_down(self, i):
+        """Move the item at index i down to its place."""
+        heap, keys, before, arity = self.heap, self._keys, self._before, self.arity
+        n = len(heap)
+        item, k = heap[i], keys[i]
+        while True:
+            first = arity * i + 1
+            if first >= n:
+                break
+            best = first
+            best_key = keys[first]
+            for child in range(first + 1, min(first + arity, n)):
+                if before(keys[child], best_key):
+                    best = child
+                    best_key = keys[child]
+            if not before(best_key, k):
+                break
+            heap[i] = heap[best]
+            keys[i] = best_key
+            i = best
+        heap[i] = item
+        keys[i] = k
     
-    def extract_min(self):
-        """Extract and return minimum element."""
-        if len(self.heap) == 0:
+    def push(self, item):
+        """Add an item."""
+        self.heap.append(item)
+        if self.key is not None:
+            self._keys.append(self.key(item))
+        self._sift_up(len(self.heap) - 1)
+    
+    def pop(self):
+        """Remove and return the item at the root."""
+        if not self.heap:
             raise IndexError("Heap is empty")
-        
-        if len(self.heap) == 1:
-            return self.heap.pop()
-        
+        last = self.heap.pop()
+        last_key = self._keys.pop() if self.key is not None else last
+        if not self.heap:
+            return last
         root = self.heap[0]
-        self.heap[0] = self.heap.pop()
-        self._heapify_down(0)
+        self.heap[0] = last
+        self._keys[0] = last_key
+        self._sift_down(0)
         return root
     
-    def _heapify_down(self, i):
-        """Maintain heap property by moving element down."""
-        smallest = i
-        left = self.left_child(i)
-        right = self.right_child(i)
-        
-        if left < len(self.heap) and self.heap[left] < self.heap[smallest]:
-            smallest = left
-        
-        if right < len(self.heap) and self.heap[right] < self.heap[smallest]:
-            smallest = right
+    def pushpop(self, item):
+        """
+        Push item, then pop the root, in one sift.
         
-        if smallest != i:
-            self.swap(i, smallest)
-            self._heapify_down(smallest)
+        If item would become the root it is returned straight away.
+        """
+        k = self.key(item) if self.key is not None else item
+        if not self.heap or not self._before(self._keys[0], k):
+            return item
+        root = self.heap[0]
+        self.heap[0] = item
+        self._keys[0] = k
+        self._sift_down(0)
+        return root
+    
+    def replace(self, item):
+        """Pop the root, then push item, in one sift."""
+        if not self.heap:
+            raise IndexError("Heap is empty")
+        root = self.heap[0]
+        self.heap[0] = item
+        self._keys[0] = self.key(item) if self.key is not None else item
+        self._sift_down(0)
+        return root
     
     def peek(self):
-        """Get minimum element without removing it."""
+        """Get the root item without removing it."""
         if len(self.heap) == 0:
             raise IndexError("Heap is empty")
         return self.heap[0]
@@ -95,72 +195,288 @@ class MinHeap:
     def is_empty(self):
         """Check if heap is empty."""
         return len(self.heap) == 0
+    
+    def __len__(self):
+        return len(self.heap)
 
 
-class MaxHeap:
-    """Max Heap implementation (parent >= children)."""
+class MinHeap(Heap):
+    """Min Heap implementation (parent <= children)."""
     
     def __init__(self):
-        self.heap = []
+        super().__init__()
     
-    def parent(self, i):
-        return (i - 1) // 2
+    @classmethod
+    def heapify(cls, iterable):
+        """Build a min-heap from an iterable in O(n)."""
+        return super().heapify(iterable)
     
-    def left_child(self, i):
-        return 2 * i + 1
+    def insert(self, value):
+        """Insert value into heap."""
+        self.push(value)
     
-    def right_child(self, i):
-        return 2 * i + 2
+    def extract_min(self):
+        """Extract and return minimum element."""
+        return self.pop()
+
+
+class MaxHeap(Heap):
+    """Max Heap implementation (parent >= children)."""
     
-    def swap(self, i, j):
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+    def __init__(self):
+        super().__init__(max_heap=True)
     
-    def insert(self, value):
-        self.heap.append(value)
-        self._heapify_up(len(self.heap) - 1)
+    @classmethod
+    def heapify(cls, iterable):
+        """Build a max-heap from an iterable in O(n)."""
+        return super().heapify(iterable, max_heap=True)
     
-    def _heapify_up(self, i):
-        while i > 0 and self.heap[self.parent(i)] < self.heap[i]:
-            self.swap(i, self.parent(i))
-            i = self.parent(i)
+    def insert(self, value):
+        """Insert value into heap."""
+        self.push(value)
     
     def extract_max(self):
-        if len(self.heap) == 0:
-            raise IndexError("Heap is empty")
+        """Extract and return maximum element."""
+        return self.pop()
+
+
+class IndexedMinHeap:
+    """
+    Min heap of distinct items with changeable priorities.
+    
+    Items must be hashable; each appears at most once. Priorities and items
+    are kept in parallel lists, and position maps an item to its index.
+    """
+    
+    def __init__(self):
+        self.priorities = []
+        self.items = []
+        self.position = {}
+    
+    def _move(self, i, priority, item):
+        """Place an entry at index i and record its position."""
+        self.priorities[i] = priority
+        self.items[i] = item
+        self.position[item] = i
+    
+    def _sift_up(self, i):
+        """Move the entry at index i up until its parent is not larger."""
+        priority, item = self.priorities[i], self.items[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if self.priorities[parent] <= priority:
+                break
+            self._move(i, self.priorities[parent], self.items[parent])
+            i = parent
+        self._move(i, priority, item)
+    
+    def _sift_down(self, i):
+        """Move the entry at index i down until no child is smaller."""
+        priorities = self.priorities
+        n = len(priorities)
+        priority, item = priorities[i], self.items[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priorities[child] >= priority:
+                break
+            self._move(i, priorities[child], self.items[child])
+            i = child
+        self._move(i, priority, item)
+    
+    def push(self, item, priority):
+        """
+        Add an item with a priority.
         
-        if len(self.heap) == 1:
-            return self.heap.pop()
+        Raises:
+            ValueError: If the item is already in the heap
+        """
+        if item in self.position:
+            raise ValueError(f"Item '{item}' already in heap")
+        self.priorities.append(priority)
+        self.items.append(item)
+        self._sift_up(len(self.items) - 1)
+    
+    def pop(self):
+        """Remove and return (item, priority) with the smallest priority."""
+        if not self.items:
+            raise IndexError("Heap is empty")
+        item, priority = self.items[0], self.priorities[0]
+        self._remove_at(0)
+        return item, priority
+    
+    def peek(self):
+        """Return (item, priority) with the smallest priority."""
+        if not self.items:
+            raise IndexError("Heap is empty")
+        return self.items[0], self.priorities[0]
+    
+    def priority(self, item):
+        """Return the current priority of an item."""
+        return self.priorities[self.position[item]]
+    
+    def decrease_key(self, item, priority):
+        """
+        Lower an item's priority.
         
-        root = self.heap[0]
-        self.heap[0] = self.heap.pop()
-        self._heapify_down(0)
-        return root
+        Raises:
+            KeyError: If the item is not in the heap
+            ValueError: If the new priority is larger than the current one
+        """
+        i = self.position[item]
+        if priority > self.priorities[i]:
+            raise ValueError("New priority is larger than the current one")
+        self.priorities[i] = priority
+        self._sift_up(i)
     
-    def _heapify_down(self, i):
-        largest = i
-        left = self.left_child(i)
-        right = self.right_child(i)
+    def increase_key(self, item, priority):
+        """
+        Raise an item's priority.
         
-        if left < len(self.heap) and self.heap[left] > self.heap[largest]:
-            largest = left
+        Raises:
+            KeyError: If the item is not in the heap
+            ValueError: If the new priority is smaller than the current one
+        """
+        i = self.position[item]
+        if priority < self.priorities[i]:
+            raise ValueError("New priority is smaller than the current one")
+        self.priorities[i] = priority
+        self._sift_down(i)
+    
+    def push_or_decrease(self, item, priority):
+        """
+        Add an item, or lower its priority if it is already present.
         
-        if right < len(self.heap) and self.heap[right] > self.heap[largest]:
-            largest = right
+        Returns:
+            True if the heap changed
+        """
+        i = self.position.get(item)
+        if i is None:
+            self.push(item, priority)
+            return True
+        if priority < self.priorities[i]:
+            self.priorities[i] = priority
+            self._sift_up(i)
+            return True
+        return False
+    
+    def remove(self, item):
+        """
+        Remove an item from the heap.
         
-        if largest != i:
-            self.swap(i, largest)
-            self._heapify_down(largest)
+        Raises:
+            KeyError: If the item is not in the heap
+        """
+        self._remove_at(self.position[item])
     
-    def peek(self):
-        if len(self.heap) == 0:
-            raise IndexError("Heap is empty")
-        return self.heap[0]
+    def _remove_at(self, i):
+        """Remove the entry at index i, filling the hole with the last entry."""
+        del self.position[self.items[i]]
+        last_priority = self.priorities.pop()
+        last_item = self.items.pop()
+        if i == len(self.items):
+            return
+        self._move(i, last_priority, last_item)
+        if i > 0 and self.priorities[(i - 1) // 2] > last_priority:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
     
     def size(self):
-        return len(self.heap)
+        """Get heap size."""
+        return len(self.items)
     
     def is_empty(self):
-        return len(self.heap) == 0
+        """Check if heap is empty."""
+        return len(self.items) == 0
+    
+    def __contains__(self, item):
+        return item in self.position
+    
+    def __len__(self):
+        return len(self.items)
+
+
+def benchmark_indexed(n=100_000, updates=100_000):
+    """
+    Compare IndexedMinHeap.decrease_key with pushing duplicates into MinHeap.
+    
+    Args:
+        n: Number of items
+        updates: Number of priority decreases
+    """
+    rng = random.Random(1)
+    initial = [1.0 + rng.random() for _ in range(n)]
+    changes = [(rng.randrange(n), rng.random()) for _ in range(updates)]
+    
+    start = time.perf_counter()
+    heap = MinHeap()
+    best = list(initial)
+    for item in range(n):
+        heap.insert((best[item], item))
+    for item, priority in changes:
+        if priority < best[item]:
+            best[item] = priority
+            heap.insert((priority, item))
+    peak = heap.size()
+    while not heap.is_empty():
+        heap.extract_min()
+    lazy_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    indexed = IndexedMinHeap()
+    for item in range(n):
+        indexed.push(item, initial[item])
+    for item, priority in changes:
+        indexed.push_or_decrease(item, priority)
+    indexed_peak = indexed.size()
+    while not indexed.is_empty():
+        indexed.pop()
+    indexed_time = time.perf_counter() - start
+    
+    print(f"  {n:,} items, {updates:,} priority decreases")
+    print(f"  MinHeap with duplicates: peak size {peak:>9,}, {lazy_time:.2f} s")
+    print(f"  IndexedMinHeap:          peak size {indexed_peak:>9,}, "
+          f"{indexed_time:.2f} s")
+
+
+def benchmark(arities=(2, 4, 8), sizes=(10_000, 100_000)):
+    """
+    Time heapify and popping every item for each arity and size.
+    
+    Larger sizes (1e6 and up) work the same way but take minutes. In pure
+    Python, interpreter overhead per step dominates memory access, so the
+    fewer levels of a 4-ary heap matter more than its cache locality.
+    
+    Args:
+        arities: Children per node to compare
+        sizes: Numbers of random floats
+    """
+    rng = random.Random(5)
+    print(f"{'size':>10} {'arity':>6} {'heapify ms':>11} {'pop all ms':>11} "
+          f"{'pushpop ms':>11}")
+    for n in sizes:
+        values = [rng.random() for _ in range(n)]
+        extra = [rng.random() for _ in range(n // 10)]
+        for arity in arities:
+            start = time.perf_counter()
+            heap = Heap.heapify(values, arity=arity)
+            heapify_ms = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            for value in extra:
+                heap.pushpop(value)
+            pushpop_ms = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            while heap.heap:
+                heap.pop()
+            pop_ms = (time.perf_counter() - start) * 1000
+            print(f"{n:>10,} {arity:>6} {heapify_ms:>11.1f} {pop_ms:>11.1f} "
+                  f"{pushpop_ms:>11.1f}")
 
 
 # Example usage
@@ -186,4 +502,28 @@ if __name__ == "__main__":
     print("\nExtracting from max heap:")
     while not max_heap.is_empty():
         print(f"  Extracted: {max_heap.extract_max()}")
-
+    
+    print("\nGeneral Heap (4-ary, max by length):")
+    words = Heap.heapify(["pear", "fig", "banana", "kiwi", "apple"], arity=4,
+                         key=len, max_heap=True)
+    print(f"  Root: {words.peek()}")
+    print(f"  pushpop('grapefruit'): {words.pushpop('grapefruit')}")
+    print(f"  replace('plum'): {words.replace('plum')}")
+    print(f"  Popped in order: {[words.pop() for _ in range(words.size())]}")
+    
+    print("\nIndexed Min Heap:")
+    indexed = IndexedMinHeap()
+    for task, priority in [("write", 5), ("read", 3), ("sync", 8), ("log", 6)]:
+        indexed.push(task, priority)
+    indexed.decrease_key("sync", 1)
+    indexed.remove("read")
+    print(f"  After decrease_key('sync', 1) and remove('read'): peek {indexed.peek()}")
+    print(f"  'read' in heap: {'read' in indexed}")
+    while not indexed.is_empty():
+        print(f"  Popped: {indexed.pop()}")
+    
+    print("\nBenchmark (arity x size):")
+    benchmark()
+    
+    print("\nBenchmark (decrease_key vs duplicate entries):")
+    benchmark_indexed()
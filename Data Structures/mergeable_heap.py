@@ -0,0 +1,457 @@
+"""
+Mergeable Heaps (Pairing Heap and Binomial Heap)
+
+Mergeable heaps combine two heaps without re-inserting every element, which
+an array-based MinHeap has to do. Both heaps here are min-heaps with the
+MinHeap interface, plus meld() and decrease_key() through the handle that
+insert() returns.
+
+Pairing heap: a single tree whose root is the minimum. Melding links two
+roots, making the larger one the first child of the smaller. Extract-min
+pairs up the root's children left to right, then links the pairs right to
+left. Simple and very fast in practice.
+
+Binomial heap: a list of binomial trees, at most one of each order k (2^k
+nodes), like the bits of a binary number. Melding adds the two lists with
+carries. The structure guarantees O(log n) worst-case bounds.
+
+Time Complexity:
+    Pairing heap:
+        - Insert, meld, peek: O(1)
+        - Extract-min: O(log n) amortized
+        - Decrease-key: o(log n) amortized
+    Binomial heap:
+        - Insert: O(1) amortized, O(log n) worst case
+        - Meld, extract-min, decrease-key: O(log n)
+        - Peek: O(1)
+
+Space Complexity: O(n)
+"""
+
+
+import random
+import time
+
+from heap import MinHeap
+
+
+class PairingNode:
+    """Pairing heap node; also the handle returned by insert()."""
+    
+    __slots__ = ("value", "child", "sibling", "prev")
+    
+    def __init__(self, value):
+        self.value = value
+        self.child = None
+        self.sibling = None
+        # Parent for a first child, otherwise the left sibling
+        self.prev = None
+
+
+def _link(a, b):
+    """Link two pairing heap roots, returning the new root."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if b.value < a.value:
+        a, b = b, a
+    b.prev = a
+    b.sibling = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    a.sibling = None
+    a.prev = None
+    return a
+
+
+class PairingHeap:
+    """Min pairing heap."""
+    
+    def __init__(self):
+        self.root = None
+        self._size = 0
+    
+    def insert(self, value):
+        """
+        Insert value into heap.
+        
+        Returns:
+            Handle for decrease_key and delete (its .value is the value)
+        """
+        node = PairingNode(value)
+        self.root = _link(self.root, node)
+        self._size += 1
+        return node
+    
+    def meld(self, other):
+        """Move every element of other into this heap in O(1); other is emptied."""
+        if other is self:
+            return
+        self.root = _link(self.root, other.root)
+        self._size += other._size
+        other.root = None
+        other._size = 0
+    
+    def peek(self):
+        """Get minimum element without removing it."""
+        if self.root is None:
+            raise IndexError("Heap is empty")
+        return self.root.value
+    
+    def extract_min(self):
+        """Extract and return minimum element."""
+        if self.root is None:
+            raise IndexError("Heap is empty")
+        root = self.root
+        self.root = self._merge_pairs(root.child)
+        root.child = None
+        self._size -= 1
+        return root.value
+    
+    @staticmethod
+    def _merge_pairs(first):
+        """Two-pass merge of a sibling list into one tree."""
+        pairs = []
+        node = first
+        while node is not None:
+            a = node
+            b = a.sibling
+            node = b.sibling if b is not None else None
+            a.sibling = a.prev = None
+            if b is not None:
+                b.sibling = b.prev = None
+            pairs.append(_link(a, b))
+        
+        root = None
+        for tree in reversed(pairs):
+            root = _link(tree, root)
+        return root
+    
+    def _cut(self, node):
+        """Detach a non-root node (and its subtree) from the tree."""
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+    
+    def decrease_key(self, node, value):
+        """
+        Lower the value of an element.
+        
+        Args:
+            node: Handle returned by insert()
+            value: New value, not larger than the current one
+        """
+        if node.value < value:
+            raise ValueError("New value is larger than the current one")
+        node.value = value
+        if node is not self.root:
+            self._cut(node)
+            self.root = _link(self.root, node)
+    
+    def delete(self, node):
+        """Remove the element with the given handle."""
+        if node is not self.root:
+            self._cut(node)
+            node.sibling = self._merge_pairs(node.child)
+            node.child = None
+            self.root = _link(self.root, node.sibling)
+            node.sibling = None
+            self._size -= 1
+        else:
+            self.extract_min()
+    
+    def size(self):
+        """Get heap size."""
+        return self._size
+    
+    def is_empty(self):
+        """Check if heap is empty."""
+        return self._size == 0
+    
+    def __len__(self):
+        return self._size
+
+
+class BinomialHandle:
+    """Handle returned by BinomialHeap.insert(); follows its value around."""
+    
+    __slots__ = ("value", "node")
+    
+    def __init__(self, value):
+        self.value = value
+        self.node = None
+
+
+class BinomialNode:
+    """Binomial tree node; children[i] is the root of a tree of order i."""
+    
+    __slots__ = ("handle", "parent", "children")
+    
+    def __init__(self, handle):
+        self.handle = handle
+        self.parent = None
+        self.children = []
+        handle.node = self
+
+
+class BinomialHeap:
+    """Min binomial heap."""
+    
+    def __init__(self):
+        # trees[k] is the root of the order-k tree, or None
+        self.trees = []
+        self._min = None
+        self._size = 0
+    
+    @staticmethod
+    def _link_trees(a, b):
+        """Link two trees of equal order, returning the new root."""
+        if b.handle.value < a.handle.value:
+            a, b = b, a
+        b.parent = a
+        a.children.append(b)
+        return a
+    
+    def _add_tree(self, tree):
+        """Add a tree to the root list, carrying like binary addition."""
+        trees = self.trees
+        order = len(tree.children)
+        while order < len(trees) and trees[order] is not None:
+            tree = self._link_trees(tree, trees[order])
+            trees[order] = None
+            order += 1
+        if order >= len(trees):
+            trees.extend([None] * (order + 1 - len(trees)))
+        trees[order] = tree
+    
+    def _find_min(self):
+        """Recompute the minimum root."""
+        self._min = None
+        for tree in self.trees:
+            if tree is not None and (self._min is None
+                                     or tree.handle.value < self._min.handle.value):
+                self._min = tree
+    
+    def insert(self, value):
+        """
+        Insert value into heap.
+        
+        Returns:
+            Handle for decrease_key and delete (its .value is the value)
+        """
+        handle = BinomialHandle(value)
+        node = BinomialNode(handle)
+        self._add_tree(node)
+        self._size += 1
+        # Carries can re-root trees, but the smaller root always survives
+        if self._min is None or value < self._min.handle.value:
+            self._min = node
+        elif self._min.parent is not None:
+            self._find_min()
+        return handle
+    
+    def meld(self, other):
+        """Move every element of other into this heap in O(log n); other is emptied."""
+        if other is self:
+            return
+        for tree in other.trees:
+            if tree is not None:
+                self._add_tree(tree)
+        self._size += other._size
+        other.trees = []
+        other._min = None
+        other._size = 0
+        self._find_min()
+    
+    def peek(self):
+        """Get minimum element without removing it."""
+        if self._min is None:
+            raise IndexError("Heap is empty")
+        return self._min.handle.value
+    
+    def extract_min(self):
+        """Extract and return minimum element."""
+        if self._min is None:
+            raise IndexError("Heap is empty")
+        root = self._min
+        self.trees[len(root.children)] = None
+        while self.trees and self.trees[-1] is None:
+            self.trees.pop()
+        for child in root.children:
+            child.parent = None
+            self._add_tree(child)
+        self._size -= 1
+        self._find_min()
+        return root.handle.value
+    
+    def _bubble_up(self, node, to_root=False):
+        """Swap a node's handle up towards the root; return its final node."""
+        handle = node.handle
+        parent = node.parent
+        while parent is not None and (to_root or handle.value < parent.handle.value):
+            node.handle = parent.handle
+            node.handle.node = node
+            node = parent
+            parent = node.parent
+        node.handle = handle
+        handle.node = node
+        return node
+    
+    def decrease_key(self, handle, value):
+        """
+        Lower the value of an element.
+        
+        Args:
+            handle: Handle returned by insert()
+            value: New value, not larger than the current one
+        """
+        if handle.value < value:
+            raise ValueError("New value is larger than the current one")
+        handle.value = value
+        node = self._bubble_up(handle.node)
+        if node.parent is None and value < self._min.handle.value:
+            self._min = node
+    
+    def delete(self, handle):
+        """Remove the element with the given handle."""
+        self._min = self._bubble_up(handle.node, to_root=True)
+        self.extract_min()
+    
+    def size(self):
+        """Get heap size."""
+        return self._size
+    
+    def is_empty(self):
+        """Check if heap is empty."""
+        return self._size == 0
+    
+    def __len__(self):
+        return self._size
+
+
+def _dijkstra_handles(graph, heap_class):
+    """Dijkstra with decrease_key on a mergeable heap."""
+    distances = {0: 0}
+    heap = heap_class()
+    handles = {0: heap.insert((0, 0))}
+    while not heap.is_empty():
+        dist, vertex = heap.extract_min()
+        del handles[vertex]
+        for neighbor, weight in graph[vertex]:
+            distance = dist + weight
+            if distance < distances.get(neighbor, float("inf")):
+                distances[neighbor] = distance
+                if neighbor in handles:
+                    heap.decrease_key(handles[neighbor], (distance, neighbor))
+                else:
+                    handles[neighbor] = heap.insert((distance, neighbor))
+    return distances
+
+
+def _dijkstra_min_heap(graph):
+    """Dijkstra pushing duplicate entries into a MinHeap."""
+    distances = {0: 0}
+    heap = MinHeap()
+    heap.insert((0, 0))
+    while not heap.is_empty():
+        dist, vertex = heap.extract_min()
+        if dist > distances[vertex]:
+            continue
+        for neighbor, weight in graph[vertex]:
+            distance = dist + weight
+            if distance < distances.get(neighbor, float("inf")):
+                distances[neighbor] = distance
+                heap.insert((distance, neighbor))
+    return distances
+
+
+def benchmark(n=100_000, shards=100, vertices=20_000, degree=10):
+    """
+    Compare MinHeap, PairingHeap and BinomialHeap on three workloads.
+    
+    insert-heavy: n inserts, then n / 10 extractions.
+    meld-heavy: combine `shards` heaps of n / shards elements into one
+    (MinHeap must re-insert every element).
+    dijkstra: shortest paths on a random graph; the mergeable heaps use
+    decrease_key, MinHeap pushes duplicates.
+    
+    Args:
+        n: Elements for the insert- and meld-heavy workloads
+        shards: Number of heaps to meld
+        vertices: Vertices in the random graph
+        degree: Out-edges per vertex
+    """
+    rng = random.Random(9)
+    values = [rng.random() for _ in range(n)]
+    graph = {u: [(rng.randrange(vertices), rng.randint(1, 100)) for _ in range(degree)]
+             for u in range(vertices)}
+    expected = _dijkstra_min_heap(graph)
+    
+    print(f"{'heap':>14} {'insert-heavy ms':>16} {'meld-heavy ms':>14} "
+          f"{'dijkstra ms':>12}")
+    for heap_class in (MinHeap, PairingHeap, BinomialHeap):
+        start = time.perf_counter()
+        heap = heap_class()
+        for value in values:
+            heap.insert(value)
+        for _ in range(n // 10):
+            heap.extract_min()
+        insert_ms = (time.perf_counter() - start) * 1000
+        
+        parts = []
+        per_shard = n // shards
+        for s in range(shards):
+            part = heap_class()
+            for value in values[s * per_shard:(s + 1) * per_shard]:
+                part.insert(value)
+            parts.append(part)
+        start = time.perf_counter()
+        combined = parts[0]
+        for part in parts[1:]:
+            if heap_class is MinHeap:
+                for value in part.heap:
+                    combined.insert(value)
+            else:
+                combined.meld(part)
+        meld_ms = (time.perf_counter() - start) * 1000
+        assert combined.size() == per_shard * shards
+        
+        start = time.perf_counter()
+        if heap_class is MinHeap:
+            distances = _dijkstra_min_heap(graph)
+        else:
+            distances = _dijkstra_handles(graph, heap_class)
+        dijkstra_ms = (time.perf_counter() - start) * 1000
+        assert distances == expected
+        
+        print(f"{heap_class.__name__:>14} {insert_ms:>16.1f} {meld_ms:>14.2f} "
+              f"{dijkstra_ms:>12.1f}")
+
+
+# Example usage
+if __name__ == "__main__":
+    for heap_class in (PairingHeap, BinomialHeap):
+        print(f"{heap_class.__name__}:")
+        heap = heap_class()
+        handles = {value: heap.insert(value) for value in [7, 3, 9, 5]}
+        other = heap_class()
+        for value in [8, 1, 6]:
+            other.insert(value)
+        
+        heap.meld(other)
+        print(f"  After meld: size {heap.size()}, min {heap.peek()}, "
+              f"other empty: {other.is_empty()}")
+        heap.decrease_key(handles[9], 0)
+        print(f"  After decrease_key(9 -> 0): min {heap.peek()}")
+        heap.delete(handles[5])
+        print(f"  After delete(5): {[heap.extract_min() for _ in range(heap.size())]}")
+        print()
+    
+    print("Benchmark (MinHeap vs mergeable heaps):")
+    benchmark()
@@ -0,0 +1,278 @@
+"""
+Radix Tree (Compressed Trie / Patricia Tree)
+
+A radix tree is a trie in which every chain of single-child nodes is merged
+into one edge labelled with a substring. A plain trie allocates one node
+(and one children dict) per character; a radix tree allocates at most two
+nodes per stored word, no matter how long the words are. Long keys with
+shared prefixes, such as URLs and file paths, shrink the most.
+
+Children are keyed by the first character of their edge label, which is
+unique among siblings, so each step still costs one dict lookup followed by
+a substring comparison. The API matches Trie.
+
+Time Complexity:
+    - Insertion: O(m) where m is length of string
+    - Search: O(m)
+    - Prefix search: O(m)
+    - Deletion: O(m)
+
+Space Complexity: O(N) nodes for N strings, plus the edge labels
+
+Applications:
+    - IP routing tables
+    - URL and path dictionaries
+    - Key-value stores with shared key prefixes
+"""
+
+
+import time
+import tracemalloc
+
+from trie import Trie
+
+
+class RadixNode:
+    """Node class for radix tree; label is the edge leading into the node."""
+    
+    __slots__ = ("label", "children", "is_end_of_word")
+    
+    def __init__(self, label=""):
+        self.label = label
+        self.children = {}
+        self.is_end_of_word = False
+
+
+class RadixTree:
+    """Radix tree with the same interface as Trie."""
+    
+    def __init__(self):
+        self.root = RadixNode()
+    
+    def insert(self, word):
+        """Insert a word into the tree."""
+        node = self.root
+        i = 0
+        
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None:
+                leaf = RadixNode(word[i:])
+                leaf.is_end_of_word = True
+                node.children[word[i]] = leaf
+                return
+            
+            label = child.label
+            if word.startswith(label, i):
+                node = child
+                i += len(label)
+                continue
+            
+            # Split the edge where the word and the label diverge
+            j = 1
+            while i + j < len(word) and word[i + j] == label[j]:
+                j += 1
+            middle = RadixNode(label[:j])
+            child.label = label[j:]
+            middle.children[child.label[0]] = child
+            node.children[word[i]] = middle
+            node = middle
+            i += j
+        
+        node.is_end_of_word = True
+    
+    def _find(self, word):
+        """Return the node whose path spells exactly word, or None."""
+        node = self.root
+        i = 0
+        
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None or not word.startswith(child.label, i):
+                return None
+            node = child
+            i += len(child.label)
+        
+        return node
+    
+    def search(self, word):
+        """Search for a word in the tree."""
+        node = self._find(word)
+        return node is not None and node.is_end_of_word
+    
+    def _find_prefix(self, prefix):
+        """
+        Locate the subtree holding every word that starts with prefix.
+        
+        Returns:
+            Tuple (node, path) where path is the string spelled out to node
+            and starts with prefix, or (None, None) if no word matches
+        """
+        node = self.root
+        i = 0
+        
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return None, None
+            label = child.label
+            # The prefix may end part-way along an edge
+            if len(prefix) - i < len(label):
+                if label.startswith(prefix[i:]):
+                    return child, prefix[:i] + label
+                return None, None
+            if not prefix.startswith(label, i):
+                return None, None
+            node = child
+            i += len(label)
+        
+        return node, prefix
+    
+    def starts_with(self, prefix):
+        """Check if any word in tree starts with the given prefix."""
+        return self._find_prefix(prefix)[0] is not None
+    
+    def delete(self, word):
+        """Delete a word from the tree."""
+        parent, node = None, self.root
+        i = 0
+        
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None or not word.startswith(child.label, i):
+                return
+            parent, node = node, child
+            i += len(child.label)
+        
+        if not node.is_end_of_word:
+            return
+        node.is_end_of_word = False
+        
+        if node is self.root:
+            return
+        if not node.children:
+            del parent.children[node.label[0]]
+            # The parent may now be a pass-through node that can be merged
+            if parent is not self.root and not parent.is_end_of_word:
+                self._merge_single_child(parent)
+        else:
+            self._merge_single_child(node)
+    
+    @staticmethod
+    def _merge_single_child(node):
+        """Absorb node's only child into node, if it has exactly one."""
+        if len(node.children) != 1:
+            return
+        (child,) = node.children.values()
+        node.label += child.label
+        node.children = child.children
+        node.is_end_of_word = child.is_end_of_word
+    
+    def get_all_words(self, prefix=""):
+        """Get all words with given prefix."""
+        node, path = self._find_prefix(prefix)
+        if node is None:
+            return []
+        
+        words = []
+        stack = [(node, path)]
+        while stack:
+            node, path = stack.pop()
+            if node.is_end_of_word:
+                words.append(path)
+            for child in reversed(list(node.children.values())):
+                stack.append((child, path + child.label))
+        return words
+    
+    def node_count(self):
+        """Return the number of nodes, including the root."""
+        return _count_nodes(self.root)
+
+
+def _count_nodes(root):
+    """Count the nodes below and including root of a Trie or RadixTree."""
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children.values())
+    return count
+
+
+def _build(tree_class, words):
+    """Insert words into a new tree of the given class."""
+    tree = tree_class()
+    for word in words:
+        tree.insert(word)
+    return tree
+
+
+def benchmark(n=50_000):
+    """
+    Compare memory and lookup throughput of Trie and RadixTree on URL paths.
+    
+    Memory is what tracemalloc sees allocated by one build. Larger n
+    (millions of keys) works the same way but takes minutes.
+    
+    Args:
+        n: Number of URLs
+    """
+    sections = ["products", "blog", "docs/api/v2", "users/profile", "static/img"]
+    words = [f"https://example.com/{sections[i % 5]}/{i * 7919 % n:07d}/index.html"
+             for i in range(n)]
+    
+    print(f"  {n:,} URLs, average length {sum(map(len, words)) / n:.0f} chars")
+    print(f"{'structure':>12} {'nodes':>10} {'memory MB':>10} {'build s':>8} "
+          f"{'lookups/s':>11}")
+    for name, tree_class in (("Trie", Trie), ("RadixTree", RadixTree)):
+        tracemalloc.start()
+        tree = _build(tree_class, words)
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+        
+        start = time.perf_counter()
+        tree = _build(tree_class, words)
+        build_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for word in words:
+            tree.search(word)
+        rate = n / (time.perf_counter() - start)
+        
+        print(f"{name:>12} {_count_nodes(tree.root):>10,} {allocated / 1e6:>10.1f} "
+              f"{build_time:>8.2f} {rate:>11,.0f}")
+
+
+# Example usage
+if __name__ == "__main__":
+    tree = RadixTree()
+    
+    print("Inserting words:")
+    words = ["apple", "app", "application", "apply", "banana", "band"]
+    for word in words:
+        tree.insert(word)
+        print(f"  Inserted: {word}")
+    print(f"  Nodes: {tree.node_count()} (a Trie would use 21)")
+    
+    print("\nSearching:")
+    print(f"  'app': {tree.search('app')}")
+    print(f"  'apple': {tree.search('apple')}")
+    print(f"  'appl': {tree.search('appl')}")
+    
+    print("\nPrefix search:")
+    print(f"  Starts with 'app': {tree.starts_with('app')}")
+    print(f"  Starts with 'appli': {tree.starts_with('appli')}")
+    print(f"  Starts with 'xyz': {tree.starts_with('xyz')}")
+    
+    print("\nAll words with prefix 'app':")
+    print(f"  {tree.get_all_words('app')}")
+    
+    print("\nDeleting 'app':")
+    tree.delete('app')
+    print(f"  'app' exists: {tree.search('app')}")
+    print(f"  'apple' exists: {tree.search('apple')}")
+    
+    print("\nBenchmark (Trie vs RadixTree):")
+    benchmark()
@@ -0,0 +1,285 @@
+"""
+Sharded Concurrent Hash Table
+
+A sharded hash table splits its keys across N independent HashTable shards,
+each guarded by its own lock. Threads working on different shards never wait
+for each other, unlike a single table wrapped in one global lock.
+
+Reads are optimistic (a seqlock): every shard has a version counter that a
+writer bumps to an odd value before mutating and back to even afterwards.
+A reader records the version, reads without locking, and only falls back to
+the lock if the version was odd or changed in the meantime. This relies on
+the GIL making each bytecode atomic, and is switched off for incremental
+shards because their reads also migrate buckets.
+
+Time Complexity (average case):
+    - Insertion: O(1)
+    - Deletion: O(1)
+    - Search: O(1), lock-free unless it races with a writer on the same shard
+
+Space Complexity: O(n + N) for n entries and N shards
+"""
+
+
+import random
+import threading
+import time
+
+from hash_table import HashTable
+
+
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+class ShardedHashTable:
+    """Hash table partitioned over independently locked HashTable shards."""
+    
+    def __init__(self, num_shards=16, hash_function=None, **table_kwargs):
+        """
+        Initialize sharded hash table.
+        
+        Args:
+            num_shards: Number of shards (and locks)
+            hash_function: Callable mapping a key to an int (default: hash)
+            **table_kwargs: Passed to each HashTable (engine, incremental, ...)
+        """
+        self.num_shards = num_shards
+        self.hash_function = hash_function or hash
+        self.shards = [HashTable(hash_function=self.hash_function, **table_kwargs)
+                       for _ in range(num_shards)]
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+        self._versions = [0] * num_shards
+        # Incremental shards mutate themselves on get(), so reads must lock
+        self._optimistic_reads = not table_kwargs.get("incremental", False)
+    
+    def _shard_index(self, key):
+        """
+        Pick the shard for a key.
+        
+        The hash is scrambled by a multiplicative mix before range reduction,
+        so shards do not reuse the low bits that each shard's buckets use.
+        """
+        mixed = (self.hash_function(key) * _GOLDEN) & _MASK64
+        return (mixed * self.num_shards) >> 64
+    
+    def _read(self, i, operation, *args):
+        """Run a read-only shard operation, lock-free when no writer interferes."""
+        if self._optimistic_reads:
+            version = self._versions[i]
+            if not version & 1:
+                try:
+                    result = operation(*args)
+                except Exception:
+                    # A torn read can raise anything; only trust a clean one
+                    if self._versions[i] == version:
+                        raise
+                else:
+                    if self._versions[i] == version:
+                        return result
+        
+        with self._locks[i]:
+            return operation(*args)
+    
+    def _write(self, i, operation, *args):
+        """Run a mutating shard operation under the shard lock."""
+        with self._locks[i]:
+            self._versions[i] += 1
+            try:
+                return operation(*args)
+            finally:
+                self._versions[i] += 1
+    
+    def insert(self, key, value):
+        """Insert or update key-value pair."""
+        i = self._shard_index(key)
+        self._write(i, self.shards[i].insert, key, value)
+    
+    def get(self, key):
+        """Get value for a key."""
+        i = self._shard_index(key)
+        return self._read(i, self.shards[i].get, key)
+    
+    def delete(self, key):
+        """Delete key-value pair."""
+        i = self._shard_index(key)
+        return self._write(i, self.shards[i].delete, key)
+    
+    def contains(self, key):
+        """Check if key exists."""
+        i = self._shard_index(key)
+        return self._read(i, self.shards[i].contains, key)
+    
+    def compute_if_absent(self, key, factory):
+        """
+        Return the value for key, creating it with factory() if missing.
+        
+        The check and the insert happen atomically under the shard lock, so
+        factory runs at most once per key even when threads race.
+        
+        Args:
+            key: Key to look up
+            factory: Zero-argument callable producing the value to insert
+        
+        Returns:
+            The existing or newly inserted value
+        """
+        i = self._shard_index(key)
+        shard = self.shards[i]
+        
+        # Fast path: most calls find the key already present
+        try:
+            return self._read(i, shard.get, key)
+        except KeyError:
+            pass
+        
+        with self._locks[i]:
+            try:
+                return shard.get(key)
+            except KeyError:
+                value = factory()
+                self._versions[i] += 1
+                try:
+                    shard.insert(key, value)
+                finally:
+                    self._versions[i] += 1
+                return value
+    
+    def get_or_insert(self, key, default):
+        """
+        Return the value for key, atomically inserting default if missing.
+        
+        Args:
+            key: Key to look up
+            default: Value to insert when the key is absent
+        
+        Returns:
+            The existing value, or default after inserting it
+        """
+        return self.compute_if_absent(key, lambda: default)
+    
+    def items(self):
+        """
+        Yield all (key, value) pairs.
+        
+        Each shard is copied under its lock, so every shard is a consistent
+        snapshot, but shards are not captured at the same instant.
+        """
+        for lock, shard in zip(self._locks, self.shards):
+            with lock:
+                pairs = list(shard.items())
+            yield from pairs
+    
+    def __len__(self):
+        """Return number of key-value pairs."""
+        return sum(shard.size for shard in self.shards)
+    
+    def __str__(self):
+        """String representation."""
+        items = [f"{key}: {value}" for key, value in self.items()]
+        return "{" + ", ".join(items) + "}"
+
+
+class _GlobalLockTable:
+    """Baseline for the benchmark: one HashTable behind one lock."""
+    
+    def __init__(self):
+        self.table = HashTable()
+        self.lock = threading.Lock()
+    
+    def insert(self, key, value):
+        with self.lock:
+            self.table.insert(key, value)
+    
+    def contains(self, key):
+        with self.lock:
+            return self.table.contains(key)
+
+
+def _run_threads(table, num_threads, ops_per_thread, write_ratio, key_space):
+    """Run a random read/write mix on table and return operations per second."""
+    workloads = []
+    for t in range(num_threads):
+        rng = random.Random(t)
+        workloads.append([(rng.random() < write_ratio, rng.randrange(key_space))
+                          for _ in range(ops_per_thread)])
+    
+    def worker(ops):
+        insert = table.insert
+        contains = table.contains
+        for is_write, key in ops:
+            if is_write:
+                insert(key, key)
+            else:
+                contains(key)
+    
+    threads = [threading.Thread(target=worker, args=(ops,)) for ops in workloads]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return num_threads * ops_per_thread / elapsed
+
+
+def benchmark(thread_counts=(1, 4, 16), ops_per_thread=50_000, key_space=100_000):
+    """
+    Compare throughput of a globally locked HashTable and ShardedHashTable.
+    
+    Under the GIL, Python code never runs on two cores at once, so this
+    measures lock overhead and contention rather than parallel speedup.
+    
+    Args:
+        thread_counts: Numbers of threads to run
+        ops_per_thread: Operations performed by each thread
+        key_space: Number of distinct keys
+    """
+    mixes = [("read-heavy", 0.05), ("write-heavy", 0.5)]
+    print(f"{'mix':>12} {'threads':>8} {'global lock ops/s':>18} {'sharded ops/s':>14}")
+    for mix_name, write_ratio in mixes:
+        for num_threads in thread_counts:
+            rates = []
+            for make_table in (_GlobalLockTable, ShardedHashTable):
+                table = make_table()
+                for key in range(0, key_space, 2):
+                    table.insert(key, key)
+                rates.append(_run_threads(table, num_threads, ops_per_thread,
+                                          write_ratio, key_space))
+            print(f"{mix_name:>12} {num_threads:>8} {rates[0]:>18,.0f} "
+                  f"{rates[1]:>14,.0f}")
+
+
+# Example usage
+if __name__ == "__main__":
+    table = ShardedHashTable(num_shards=4)
+    
+    print("Inserting key-value pairs:")
+    for fruit, count in [("apple", 5), ("banana", 3), ("cherry", 8)]:
+        table.insert(fruit, count)
+    print(f"  {table}")
+    print(f"  Size: {len(table)}")
+    
+    print(f"\nGet 'apple': {table.get('apple')}")
+    print(f"Contains 'date': {table.contains('date')}")
+    
+    print("\nget_or_insert / compute_if_absent:")
+    print(f"  get_or_insert('date', 1): {table.get_or_insert('date', 1)}")
+    print(f"  get_or_insert('date', 99): {table.get_or_insert('date', 99)}")
+    
+    calls = []
+    
+    def expensive():
+        calls.append(1)
+        return "computed"
+    
+    threads = [threading.Thread(target=table.compute_if_absent,
+                                args=("config", expensive)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"  8 threads raced on 'config': factory ran {len(calls)} time(s)")
+    
+    print("\nBenchmark (global lock vs sharded):")
+    benchmark()
@@ -0,0 +1,321 @@
+"""
+Streaming Statistics on Heaps (Top-k, Running Median, Sliding-Window Median)
+
+These structures consume an unbounded stream one element (or one chunk) at
+a time, in O(log k) per element, instead of collecting the stream into a
+list and sorting it:
+    - TopK: the k largest items seen so far, kept in a size-k min-heap. A
+      new item only enters by replacing the smallest of the k (pushpop).
+    - RunningMedian: the two-heap technique. A max-heap holds the lower half
+      and a min-heap the upper half, so the median sits at their roots.
+    - SlidingWindowMedian: the median of the last w items. Items leaving the
+      window are deleted lazily: they are counted in a table and discarded
+      when they reach the root of a heap. Deleted items that never reach a
+      root (as in a monotone stream) would pile up, so once the heaps hold
+      more than 2w items they are rebuilt from the window.
+
+Memory: TopK keeps k items and SlidingWindowMedian at most 2w items in its
+heaps, besides the window itself. An exact median of a whole
+unbounded stream cannot be computed in constant memory, so RunningMedian
+keeps every item, in heaps rather than in a list that is sorted repeatedly.
+
+Time Complexity:
+    - TopK.add: O(log k)
+    - RunningMedian.add: O(log n)
+    - SlidingWindowMedian.add: O(log w) amortized
+    - Reading the result: O(1) (O(k log k) for TopK.result)
+
+Space Complexity: O(k), O(n) and O(w) respectively
+"""
+
+
+import bisect
+import random
+import statistics
+import time
+import tracemalloc
+from collections import deque
+
+from heap import Heap, MaxHeap, MinHeap
+
+
+class TopK:
+    """The k largest items of a stream."""
+    
+    def __init__(self, k, key=None):
+        """
+        Initialize tracker.
+        
+        Args:
+            k: Number of items to keep
+            key: Function giving the value items are ranked by
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.key = key
+        # Min-heap of the current top k: its root is the first to be displaced
+        self.heap = Heap(key=key)
+    
+    def add(self, item):
+        """Offer an item to the top k."""
+        if len(self.heap) < self.k:
+            self.heap.push(item)
+        else:
+            self.heap.pushpop(item)
+    
+    def update(self, items):
+        """Offer every item of an iterable or chunk."""
+        heap = self.heap
+        for item in items:
+            if len(heap) < self.k:
+                heap.push(item)
+            else:
+                heap.pushpop(item)
+    
+    def result(self):
+        """Return the top items, largest first."""
+        return sorted(self.heap.heap, key=self.key, reverse=True)
+    
+    def __len__(self):
+        return len(self.heap)
+
+
+class RunningMedian:
+    """Median of every value seen so far."""
+    
+    def __init__(self):
+        self.low = MaxHeap()
+        self.high = MinHeap()
+    
+    def add(self, value):
+        """Add a value to the stream."""
+        if self.low.is_empty() or value <= self.low.peek():
+            self.low.insert(value)
+        else:
+            self.high.insert(value)
+        
+        # Keep len(low) == len(high) or len(high) + 1
+        if self.low.size() > self.high.size() + 1:
+            self.high.insert(self.low.extract_max())
+        elif self.high.size() > self.low.size():
+            self.low.insert(self.high.extract_min())
+    
+    def update(self, values):
+        """Add every value of an iterable or chunk."""
+        for value in values:
+            self.add(value)
+    
+    def median(self):
+        """Return the median (mean of the middle two for an even count)."""
+        if self.low.is_empty():
+            raise IndexError("No values yet")
+        if self.low.size() > self.high.size():
+            return self.low.peek()
+        return (self.low.peek() + self.high.peek()) / 2
+    
+    def __len__(self):
+        return self.low.size() + self.high.size()
+
+
+class SlidingWindowMedian:
+    """Median of the last `window` values of a stream."""
+    
+    def __init__(self, window):
+        """
+        Initialize tracker.
+        
+        Args:
+            window: Number of most recent values the median covers
+        """
+        if window < 1:
+            raise ValueError("Window must be at least 1")
+        self.window = window
+        self.values = deque()
+        self.low = MaxHeap()
+        self.high = MinHeap()
+        # Live (not lazily deleted) counts in each heap
+        self.low_size = 0
+        self.high_size = 0
+        # Value -> number of copies waiting to be discarded
+        self.delayed = {}
+    
+    def _compact(self):
+        """Rebuild both heaps from the window, dropping every deleted value."""
+        ordered = sorted(self.values)
+        self.low = MaxHeap.heapify(ordered[:self.low_size])
+        self.high = MinHeap.heapify(ordered[self.low_size:])
+        self.delayed.clear()
+    
+    def _prune(self, heap):
+        """Discard lazily deleted values sitting at the root of heap."""
+        delayed = self.delayed
+        while not heap.is_empty() and delayed.get(heap.peek()):
+            value = heap.pop()
+            delayed[value] -= 1
+            if delayed[value] == 0:
+                del delayed[value]
+    
+    def _rebalance(self):
+        """Restore low_size == high_size or high_size + 1."""
+        if self.low_size > self.high_size + 1:
+            self.high.insert(self.low.extract_max())
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low)
+        elif self.high_size > self.low_size:
+            self.low.insert(self.high.extract_min())
+            self.high_size -= 1
+            self.low_size += 1
+            self._prune(self.high)
+    
+    def _remove(self, value):
+        """Lazily delete a value that left the window."""
+        self.delayed[value] = self.delayed.get(value, 0) + 1
+        if value <= self.low.peek():
+            self.low_size -= 1
+            if value == self.low.peek():
+                self._prune(self.low)
+        else:
+            self.high_size -= 1
+            if value == self.high.peek():
+                self._prune(self.high)
+        self._rebalance()
+    
+    def add(self, value):
+        """Add a value, dropping the oldest one if the window is full."""
+        self.values.append(value)
+        if self.low.is_empty() or value <= self.low.peek():
+            self.low.insert(value)
+            self.low_size += 1
+        else:
+            self.high.insert(value)
+            self.high_size += 1
+        self._rebalance()
+        
+        if len(self.values) > self.window:
+            self._remove(self.values.popleft())
+            # Rebuilding costs O(w log w) after at least w additions
+            if len(self.low) + len(self.high) > 2 * self.window:
+                self._compact()
+    
+    def update(self, values):
+        """
+        Add every value of an iterable or chunk.
+        
+        Returns:
+            List of the median after each value
+        """
+        medians = []
+        for value in values:
+            self.add(value)
+            medians.append(self.median())
+        return medians
+    
+    def median(self):
+        """Return the median of the current window."""
+        if not self.values:
+            raise IndexError("No values yet")
+        if self.low_size > self.high_size:
+            return self.low.peek()
+        return (self.low.peek() + self.high.peek()) / 2
+    
+    def __len__(self):
+        return len(self.values)
+
+
+def benchmark(n=200_000, k=100, window=1_001):
+    """
+    Compare the streaming structures with collect-and-sort baselines.
+    
+    Args:
+        n: Stream length
+        k: Items kept by TopK
+        window: Window length for the sliding median
+    """
+    rng = random.Random(21)
+    stream = [rng.gauss(100, 15) for _ in range(n)]
+    
+    tracemalloc.start()
+    start = time.perf_counter()
+    top = TopK(k)
+    top.update(iter(stream))
+    result = top.result()
+    top_time = time.perf_counter() - start
+    top_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    start = time.perf_counter()
+    collected = list(iter(stream))
+    expected = sorted(collected, reverse=True)[:k]
+    sort_time = time.perf_counter() - start
+    sort_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert result == expected
+    
+    start = time.perf_counter()
+    running = RunningMedian()
+    running.update(stream)
+    running_time = time.perf_counter() - start
+    assert running.median() == statistics.median(stream)
+    
+    sample = stream[:n // 10]
+    start = time.perf_counter()
+    sliding = SlidingWindowMedian(window).update(sample)
+    sliding_time = time.perf_counter() - start
+    
+    # Baseline: keep the window sorted with bisect and index the middle
+    start = time.perf_counter()
+    ordered, naive = [], []
+    for i, value in enumerate(sample):
+        bisect.insort(ordered, value)
+        if i >= window:
+            del ordered[bisect.bisect_left(ordered, sample[i - window])]
+        naive.append(statistics.median(ordered))
+    naive_time = time.perf_counter() - start
+    assert sliding == naive
+    
+    # A monotone stream never brings deleted values to a root
+    for values in (range(n // 10), range(n // 10, 0, -1)):
+        tracker = SlidingWindowMedian(11)
+        for value in values:
+            tracker.add(value)
+            assert len(tracker.low) + len(tracker.high) <= 2 * 11
+        assert len(tracker.delayed) <= 2 * 11
+    
+    print(f"  Top {k} of {n:,}:")
+    print(f"    TopK:           {top_time * 1000:>8.1f} ms, "
+          f"peak {top_peak / 1024:>8.1f} KB")
+    print(f"    Collect + sort: {sort_time * 1000:>8.1f} ms, "
+          f"peak {sort_peak / 1024:>8.1f} KB")
+    print(f"  Running median of {n:,}: {running_time * 1000:.1f} ms")
+    print(f"  Window-{window} median of {len(sample):,}:")
+    print(f"    Two heaps:      {sliding_time * 1000:>8.1f} ms")
+    print(f"    Sorted list:    {naive_time * 1000:>8.1f} ms")
+
+
+# Example usage
+if __name__ == "__main__":
+    latencies = [120, 85, 300, 95, 110, 450, 90, 100, 130, 105]
+    
+    top = TopK(3)
+    top.update(latencies)
+    print(f"Top 3 latencies: {top.result()}")
+    
+    words = TopK(2, key=len)
+    words.update(["a", "stream", "of", "words", "arrives"])
+    print(f"Two longest words: {words.result()}")
+    
+    running = RunningMedian()
+    print("\nRunning median:")
+    for latency in latencies[:5]:
+        running.add(latency)
+        print(f"  Added {latency}: median {running.median()}")
+    
+    print("\nSliding-window median (window 3):")
+    sliding = SlidingWindowMedian(3)
+    print(f"  {sliding.update(latencies)}")
+    
+    print("\nBenchmark (streaming vs collect and sort):")
+    benchmark()
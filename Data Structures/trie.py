@@ -11,6 +11,20 @@ Time Complexity:
 
 Space Complexity: O(ALPHABET_SIZE * N * M) where N is number of strings, M is average length
 
+Words can carry a score. Every node caches the best score in its subtree,
+so top_k(prefix, k) expands only the most promising nodes from a heap
+instead of collecting and sorting every completion.
+
+fuzzy_search(word, max_distance) finds every word within an edit distance
+by walking the trie with one row of the edit-distance table per node, so
+words sharing a prefix share the work, and pruning any subtree whose row
+minimum already exceeds the bound.
+
+Trie.freeze() compiles a finished trie into a FrozenTrie: the nodes in
+level order, stored as three flat buffers (child offsets, edge labels and a
+terminal bitmap) instead of one object and dict per node. A FrozenTrie can be
+saved to a file and opened with mmap in O(1), and answers the same queries.
+
 Applications:
     - Autocomplete
     - Spell checker
@@ -19,12 +33,31 @@ Applications:
 """
 
 
+import gc
+import heapq
+import mmap
+import os
+import random
+import struct
+import tempfile
+import time
+import tracemalloc
+from bisect import bisect_left
+from itertools import islice
+
+
 class TrieNode:
     """Node class for trie."""
     
+    # Tries hold many small nodes; slots avoid a __dict__ per node
+    __slots__ = ("children", "is_end_of_word", "score", "best")
+    
     def __init__(self):
         self.children = {}
         self.is_end_of_word = False
+        self.score = None
+        # Best score of any word in this subtree (None if there is none)
+        self.best = None
 
 
 class Trie:
@@ -33,16 +66,140 @@ class Trie:
     def __init__(self):
         self.root = TrieNode()
     
-    def insert(self, word):
-        """Insert a word into the trie."""
+    def insert(self, word, score=0):
+        """
+        Insert a word into the trie, or update its score.
+        
+        Args:
+            word: Word to insert
+            score: Ranking weight used by top_k (higher is better)
+        """
         node = self.root
+        if node.best is None or score > node.best:
+            node.best = score
         
         for char in word:
             if char not in node.children:
                 node.children[char] = TrieNode()
             node = node.children[char]
+            if node.best is None or score > node.best:
+                node.best = score
         
+        lowered = node.is_end_of_word and score < node.score
         node.is_end_of_word = True
+        node.score = score
+        if lowered:
+            self._refresh_best(word)
+    
+    @classmethod
+    def from_sorted(cls, words):
+        """
+        Build a trie from words in sorted order in one streaming pass.
+        
+        Consecutive sorted words share their longest common prefix, so only
+        the nodes after that prefix are visited, and each of them is new.
+        
+        Args:
+            words: Iterable of words in ascending order (duplicates allowed)
+        
+        Returns:
+            New Trie
+        
+        Raises:
+            ValueError: If the words are not sorted
+        """
+        trie = cls()
+        trie._insert_sorted(words, check_order=True)
+        return trie
+    
+    def update(self, words):
+        """
+        Insert many words at once.
+        
+        The batch is sorted and inserted in one pass that reuses the path of
+        the previous word, with the garbage collector paused, which is faster
+        than calling insert() per word.
+        
+        Args:
+            words: Iterable of words or (word, score) pairs
+        """
+        items = [(item, 0) if isinstance(item, str) else item for item in words]
+        items.sort(key=lambda item: item[0])
+        self._insert_sorted(items, check_order=False)
+    
+    def _insert_sorted(self, items, check_order):
+        """
+        Insert words (or (word, score) pairs) arriving in sorted order.
+        
+        The cyclic garbage collector is paused meanwhile: it would otherwise
+        rescan the growing trie every few thousand new nodes, which costs
+        more than building the nodes themselves.
+        """
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._insert_sorted_pass(items, check_order)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    
+    def _insert_sorted_pass(self, items, check_order):
+        """Single pass of _insert_sorted, reusing the previous word's path."""
+        path = [self.root]
+        previous = ""
+        # Lower bound on the cached best score of every node in path
+        floor = self.root.best
+        lowered = []
+        
+        for item in items:
+            word, score = (item, 0) if isinstance(item, str) else item
+            if check_order and word < previous:
+                raise ValueError(f"Words are not sorted: {word!r} after {previous!r}")
+            
+            # Keep the nodes for the prefix shared with the previous word
+            common = _common_prefix_length(word, previous)
+            del path[common + 1:]
+            
+            if floor is None or score > floor:
+                for node in path:
+                    if node.best is None or score > node.best:
+                        node.best = score
+                floor = score
+            node = path[-1]
+            for char in word[common:]:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = TrieNode()
+                if child.best is None or score > child.best:
+                    child.best = score
+                path.append(child)
+                node = child
+            if len(word) > common:
+                floor = min(floor, score)
+            
+            if node.is_end_of_word and score < node.score:
+                lowered.append(word)
+            node.is_end_of_word = True
+            node.score = score
+            previous = word
+        
+        for word in lowered:
+            self._refresh_best(word)
+    
+    def _refresh_best(self, word):
+        """Recompute cached subtree maxima along the path spelling word."""
+        path = [self.root]
+        for char in word:
+            if char not in path[-1].children:
+                break
+            path.append(path[-1].children[char])
+        
+        for node in reversed(path):
+            scores = [child.best for child in node.children.values()
+                      if child.best is not None]
+            if node.is_end_of_word:
+                scores.append(node.score)
+            node.best = max(scores) if scores else None
     
     def search(self, word):
         """Search for a word in the trie."""
@@ -68,50 +225,527 @@ class Trie:
     
     def delete(self, word):
         """Delete a word from the trie."""
-        def _delete(node, word, index):
-            if index == len(word):
-                if not node.is_end_of_word:
-                    return False
-                node.is_end_of_word = False
-                return len(node.children) == 0
-            
-            char = word[index]
-            if char not in node.children:
-                return False
-            
-            child_node = node.children[char]
-            should_delete = _delete(child_node, word, index + 1)
-            
-            if should_delete:
-                del node.children[char]
-                return len(node.children) == 0
-            
-            return False
+        path = [self.root]
+        for char in word:
+            if char not in path[-1].children:
+                return
+            path.append(path[-1].children[char])
+        
+        node = path[-1]
+        if not node.is_end_of_word:
+            return
+        node.is_end_of_word = False
+        node.score = None
+        
+        # Prune nodes that no longer lead to any word, deepest first
+        for depth in range(len(word), 0, -1):
+            node = path[depth]
+            if node.is_end_of_word or node.children:
+                break
+            del path[depth - 1].children[word[depth - 1]]
         
-        _delete(self.root, word, 0)
+        self._refresh_best(word)
     
-    def get_all_words(self, prefix=""):
-        """Get all words with given prefix."""
+    def _find_node(self, prefix):
+        """Return the node reached by spelling prefix, or None."""
         node = self.root
-        
-        # Navigate to prefix node
         for char in prefix:
             if char not in node.children:
-                return []
+                return None
             node = node.children[char]
+        return node
+    
+    def iter_words(self, prefix=""):
+        """
+        Yield words with given prefix lazily, so callers can stop early.
         
-        # Collect all words from this node
-        words = []
+        Words come in the same order as get_all_words().
+        """
+        node = self._find_node(prefix)
+        if node is None:
+            return
+        
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if node.is_end_of_word:
+                yield word
+            for char, child in reversed(node.children.items()):
+                stack.append((child, word + char))
+    
+    def get_all_words(self, prefix=""):
+        """Get all words with given prefix."""
+        return list(self.iter_words(prefix))
+    
+    def top_k(self, prefix, k):
+        """
+        Return the k highest-scoring words with given prefix.
+        
+        Nodes are expanded best-first using their cached subtree maxima, so a
+        word is only reached once it is the best remaining candidate; about
+        k paths are explored instead of the whole subtree.
+        
+        Args:
+            prefix: Prefix to complete
+            k: Number of completions
+        
+        Returns:
+            List of (word, score), best first (ties in alphabetical order)
+        """
+        node = self._find_node(prefix)
+        if node is None or node.best is None or k <= 0:
+            return []
         
-        def _collect(node, current_word):
+        results = []
+        # Entries: (-priority, word, is_word, node). A node's prefix sorts
+        # before every word below it, so equal priorities pop alphabetically
+        heap = [(-node.best, prefix, False, node)]
+        while heap and len(results) < k:
+            _, word, is_word, node = heapq.heappop(heap)
+            if is_word:
+                results.append((word, node.score))
+                continue
             if node.is_end_of_word:
-                words.append(prefix + current_word)
+                heapq.heappush(heap, (-node.score, word, True, node))
+            for char, child in node.children.items():
+                if child.best is not None:
+                    heapq.heappush(heap, (-child.best, word + char, False, child))
+        return results
+    
+    def fuzzy_search(self, word, max_distance, transpositions=False):
+        """
+        Find all words within an edit distance of word.
+        
+        Args:
+            word: Word to match
+            max_distance: Maximum number of edits
+            transpositions: Also count swapping two adjacent characters as
+                one edit (optimal string alignment / restricted Damerau)
+        
+        Returns:
+            List of (word, distance) sorted by distance, then word
+        """
+        n = len(word)
+        matches = []
+        # Entries: (node, spelled word, current row, previous row, last char)
+        stack = [(self.root, "", list(range(n + 1)), None, "")]
+        
+        while stack:
+            node, spelled, row, prev_row, last = stack.pop()
+            if node.is_end_of_word and row[n] <= max_distance:
+                matches.append((spelled, row[n]))
+            # Every later row is at least this row's minimum
+            if min(row) > max_distance:
+                continue
             
-            for char, child_node in node.children.items():
-                _collect(child_node, current_word + char)
+            for char, child in node.children.items():
+                new_row = [row[0] + 1]
+                for j in range(1, n + 1):
+                    cost = 0 if word[j - 1] == char else 1
+                    value = min(new_row[j - 1] + 1, row[j] + 1, row[j - 1] + cost)
+                    if (transpositions and j > 1 and prev_row is not None
+                            and word[j - 1] == last and word[j - 2] == char):
+                        value = min(value, prev_row[j - 2] + 1)
+                    new_row.append(value)
+                stack.append((child, spelled + char, new_row, row, char))
         
-        _collect(node, "")
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+    
+    def freeze(self):
+        """Compile the trie into an immutable, compact FrozenTrie."""
+        return FrozenTrie.from_trie(self)
+
+
+def _common_prefix_length(a, b):
+    """Length of the longest common prefix, found by binary search on slices."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+_MAGIC = b"FTR1"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQQ")
+
+
+class FrozenTrie:
+    """
+    Read-only trie stored in flat buffers (level-order layout).
+    
+    Nodes are numbered breadth-first, with each node's children sorted by
+    character, so the children of node v are the contiguous nodes
+    offsets[v] .. offsets[v + 1] - 1 and can be binary searched by label.
+    
+    Buffer layout (native byte order after the little-endian header):
+        header    magic "FTR1", version u32, num_nodes u64, num_words u64
+        offsets   (num_nodes + 1) x u32, first child of each node
+        labels    num_nodes x u32, code point of the edge into each node
+        terminal  ceil(num_nodes / 8) bytes, bit v set if node v ends a word
+    """
+    
+    def __init__(self, buffer):
+        """
+        Wrap a buffer produced by to_bytes() without copying it.
+        
+        Args:
+            buffer: bytes, bytearray or mmap holding a frozen trie
+        """
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            view.release()
+            raise ValueError(f"Not a version {_VERSION} frozen trie")
+        magic, version, num_nodes, num_words = _HEADER.unpack_from(view)
+        size = _HEADER.size + 4 * (num_nodes + 1) + 4 * num_nodes + (num_nodes + 7) // 8
+        if magic != _MAGIC or version != _VERSION or len(view) < size:
+            # Release the view so that an mmap behind buffer can be closed
+            view.release()
+            raise ValueError(f"Not a version {_VERSION} frozen trie")
+        
+        self.num_nodes = num_nodes
+        self.num_words = num_words
+        start = _HEADER.size
+        self._offsets = view[start:start + 4 * (num_nodes + 1)].cast("I")
+        start += 4 * (num_nodes + 1)
+        self._labels = view[start:start + 4 * num_nodes].cast("I")
+        start += 4 * num_nodes
+        self._terminal = view[start:start + (num_nodes + 7) // 8]
+        self._view = view
+        self._file = None
+        self._map = None
+    
+    @classmethod
+    def from_trie(cls, trie):
+        """Compile a Trie into a FrozenTrie."""
+        offsets = []
+        labels = [0]
+        terminal = [trie.root.is_end_of_word]
+        queue = [trie.root]
+        
+        # Breadth-first numbering makes every node's children contiguous
+        for node in queue:
+            offsets.append(len(queue))
+            for char in sorted(node.children):
+                child = node.children[char]
+                labels.append(ord(char))
+                terminal.append(child.is_end_of_word)
+                queue.append(child)
+        offsets.append(len(queue))
+        
+        num_nodes = len(queue)
+        size = _HEADER.size + 4 * (num_nodes + 1) + 4 * num_nodes + (num_nodes + 7) // 8
+        buffer = bytearray(size)
+        _HEADER.pack_into(buffer, 0, _MAGIC, _VERSION, num_nodes, sum(terminal))
+        
+        start = _HEADER.size
+        view = memoryview(buffer)
+        for values in (offsets, labels):
+            array = view[start:start + 4 * len(values)].cast("I")
+            for i, value in enumerate(values):
+                array[i] = value
+            array.release()
+            start += 4 * len(values)
+        for v, is_end in enumerate(terminal):
+            if is_end:
+                buffer[start + (v >> 3)] |= 1 << (v & 7)
+        view.release()
+        return cls(buffer)
+    
+    @classmethod
+    def load(cls, path):
+        """Open a saved frozen trie with mmap; nothing is read up front."""
+        file = open(path, "rb")
+        mapped = None
+        try:
+            # Raises ValueError for an empty file
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            frozen = cls(mapped)
+        except ValueError:
+            if mapped is not None:
+                mapped.close()
+            file.close()
+            raise
+        frozen._file = file
+        frozen._map = mapped
+        return frozen
+    
+    def to_bytes(self):
+        """Return the serialized trie."""
+        return self._view.tobytes()
+    
+    def save(self, path):
+        """Write the trie to a file that load() can map."""
+        with open(path, "wb") as out:
+            out.write(self._view)
+    
+    def _child(self, v, char):
+        """Return the child of node v along char, or -1 if there is none."""
+        lo, hi = self._offsets[v], self._offsets[v + 1]
+        code = ord(char)
+        i = bisect_left(self._labels, code, lo, hi)
+        if i < hi and self._labels[i] == code:
+            return i
+        return -1
+    
+    def _is_terminal(self, v):
+        """Check the terminal bit of node v."""
+        return self._terminal[v >> 3] >> (v & 7) & 1 == 1
+    
+    def _find(self, word):
+        """Return the node reached by spelling word, or -1."""
+        v = 0
+        for char in word:
+            v = self._child(v, char)
+            if v < 0:
+                return -1
+        return v
+    
+    def search(self, word):
+        """Search for a word in the trie."""
+        v = self._find(word)
+        return v >= 0 and self._is_terminal(v)
+    
+    def starts_with(self, prefix):
+        """Check if any word in trie starts with the given prefix."""
+        return self._find(prefix) >= 0
+    
+    def get_all_words(self, prefix=""):
+        """Get all words with given prefix, in code point order."""
+        v = self._find(prefix)
+        if v < 0:
+            return []
+        
+        offsets, labels = self._offsets, self._labels
+        words = []
+        stack = [(v, prefix)]
+        while stack:
+            v, word = stack.pop()
+            if self._is_terminal(v):
+                words.append(word)
+            for child in range(offsets[v + 1] - 1, offsets[v] - 1, -1):
+                stack.append((child, word + chr(labels[child])))
         return words
+    
+    def nbytes(self):
+        """Return the size of the flat representation in bytes."""
+        return self._view.nbytes
+    
+    def close(self):
+        """Release the buffers and unmap the file, if one was loaded."""
+        for attribute in ("_offsets", "_labels", "_terminal", "_view"):
+            getattr(self, attribute).release()
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        """Return number of words."""
+        return self.num_words
+
+
+def benchmark(n=100_000):
+    """
+    Compare a Trie with its frozen form: memory, lookups and load time.
+    
+    Larger n (millions of words) works the same way but takes minutes.
+    
+    Args:
+        n: Number of random words
+    """
+    rng = random.Random(42)
+    letters = "etaoinshrdlucmfwypvbgkjqxz"
+    words = ["".join(rng.choice(letters[:rng.randint(6, 26)])
+                     for _ in range(rng.randint(4, 12))) for _ in range(n)]
+    
+    tracemalloc.start()
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    trie_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    frozen = trie.freeze()
+    freeze_time = time.perf_counter() - start
+    
+    fd, path = tempfile.mkstemp(suffix=".trie")
+    os.close(fd)
+    frozen.save(path)
+    start = time.perf_counter()
+    loaded = FrozenTrie.load(path)
+    load_time = time.perf_counter() - start
+    
+    rates = []
+    for structure in (trie, loaded):
+        start = time.perf_counter()
+        for word in words:
+            structure.search(word)
+        rates.append(n / (time.perf_counter() - start))
+    
+    print(f"  {n:,} words, {frozen.num_nodes:,} nodes")
+    print(f"  Trie memory:        {trie_bytes / 1e6:>8.1f} MB")
+    print(f"  FrozenTrie size:    {frozen.nbytes() / 1e6:>8.1f} MB")
+    print(f"  Freeze time:        {freeze_time * 1000:>8.1f} ms")
+    print(f"  mmap load time:     {load_time * 1000:>8.3f} ms")
+    print(f"  Trie lookups:       {rates[0]:>8,.0f} /s")
+    print(f"  FrozenTrie lookups: {rates[1]:>8,.0f} /s")
+    
+    loaded.close()
+    os.unlink(path)
+
+
+def edit_distance(a, b, transpositions=False):
+    """
+    Levenshtein distance between two strings (the linear-scan baseline).
+    
+    Args:
+        a: First string
+        b: Second string
+        transpositions: Count adjacent swaps as one edit
+    
+    Returns:
+        Minimum number of edits turning a into b
+    """
+    prev_row = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        new_row = [i]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(new_row[j - 1] + 1, row[j] + 1, row[j - 1] + cost)
+            if (transpositions and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, prev_row[j - 2] + 1)
+            new_row.append(value)
+        prev_row, row = row, new_row
+    return row[-1]
+
+
+def benchmark_fuzzy(n=50_000, queries=20):
+    """
+    Compare Trie.fuzzy_search with scanning the vocabulary linearly.
+    
+    The linear scan computes edit_distance against every word. A 1M-word
+    vocabulary works the same way, but the linear scan then takes minutes.
+    
+    Args:
+        n: Vocabulary size
+        queries: Misspelled query words per distance
+    """
+    rng = random.Random(11)
+    letters = "etaoinshrdlucmfwypvbgkjqxz"
+    vocabulary = list({"".join(rng.choice(letters) for _ in range(rng.randint(4, 10)))
+                       for _ in range(n)})
+    trie = Trie()
+    for word in vocabulary:
+        trie.insert(word)
+    
+    def misspell(word):
+        i = rng.randrange(len(word))
+        return word[:i] + rng.choice(letters) + word[i + 1:]
+    
+    samples = [misspell(rng.choice(vocabulary)) for _ in range(queries)]
+    print(f"  {len(vocabulary):,} words, {queries} queries")
+    print(f"{'distance':>9} {'linear scan ms/query':>21} {'trie ms/query':>14} "
+          f"{'matches':>8}")
+    for max_distance in (1, 2):
+        start = time.perf_counter()
+        expected = [sorted(word for word in vocabulary
+                           if edit_distance(query, word) <= max_distance)
+                    for query in samples]
+        scan_ms = (time.perf_counter() - start) * 1000 / queries
+        
+        start = time.perf_counter()
+        found = [trie.fuzzy_search(query, max_distance) for query in samples]
+        trie_ms = (time.perf_counter() - start) * 1000 / queries
+        
+        assert expected == [sorted(word for word, _ in matches) for matches in found]
+        total = sum(map(len, found))
+        print(f"{max_distance:>9} {scan_ms:>21.1f} {trie_ms:>14.2f} {total:>8}")
+
+
+def benchmark_build(sizes=(100_000, 300_000)):
+    """
+    Compare build times: insert() per word, update() and from_sorted().
+    
+    1M and 10M keys work the same way, but need minutes and many GB of
+    memory with one object per trie node.
+    
+    Args:
+        sizes: Numbers of keys to build from
+    """
+    print(f"{'keys':>10} {'insert s':>9} {'update s':>9} {'from_sorted s':>14}")
+    for n in sizes:
+        words = sorted(f"/srv/data/{i % 97:02d}/{i * 7919 % n:09d}.log" for i in range(n))
+        start = time.perf_counter()
+        trie = Trie()
+        for word in words:
+            trie.insert(word)
+        insert_time = time.perf_counter() - start
+        del trie
+        
+        start = time.perf_counter()
+        trie = Trie()
+        trie.update(words)
+        update_time = time.perf_counter() - start
+        del trie
+        
+        start = time.perf_counter()
+        trie = Trie.from_sorted(words)
+        sorted_time = time.perf_counter() - start
+        del trie
+        print(f"{n:>10,} {insert_time:>9.2f} {update_time:>9.2f} {sorted_time:>14.2f}")
+
+
+def benchmark_top_k(n=200_000, k=10):
+    """
+    Compare top_k with collecting, sorting and truncating every completion.
+    
+    Scores follow a Zipf-like distribution, as word frequencies do.
+    
+    Args:
+        n: Number of random words
+        k: Completions per query
+    """
+    rng = random.Random(7)
+    letters = "etaoinshrdlucmfwypvbgkjqxz"
+    trie = Trie()
+    scores = {}
+    for rank in range(1, n + 1):
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        scores[word] = n // rank
+        trie.insert(word, scores[word])
+    
+    print(f"  {len(scores):,} words, k={k}")
+    print(f"{'prefix':>8} {'matches':>8} {'sort all ms':>12} {'top_k ms':>9} "
+          f"{'first k lazy ms':>16}")
+    for prefix in ("", "e", "ta", "sho"):
+        start = time.perf_counter()
+        words = trie.get_all_words(prefix)
+        expected = sorted(words, key=lambda word: (-scores[word], word))[:k]
+        sort_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        best = trie.top_k(prefix, k)
+        top_ms = (time.perf_counter() - start) * 1000
+        assert [(word, scores[word]) for word in expected] == best
+        
+        start = time.perf_counter()
+        list(islice(trie.iter_words(prefix), k))
+        lazy_ms = (time.perf_counter() - start) * 1000
+        print(f"{prefix!r:>8} {len(words):>8,} {sort_ms:>12.2f} {top_ms:>9.3f} "
+              f"{lazy_ms:>16.3f}")
 
 
 # Example usage
@@ -141,4 +775,45 @@ if __name__ == "__main__":
     trie.delete('app')
     print(f"  'app' exists: {trie.search('app')}")
     print(f"  'apple' exists: {trie.search('apple')}")
+    
+    print("\nBulk building and very long keys:")
+    sorted_trie = Trie.from_sorted(sorted(words))
+    sorted_trie.update(["apricot", "bandana"])
+    print(f"  from_sorted + update: {sorted_trie.get_all_words()}")
+    long_word = "ACGT" * 5000
+    sorted_trie.insert(long_word)
+    sorted_trie.delete(long_word)
+    print(f"  Inserted and deleted a {len(long_word):,}-character key without recursion")
+    
+    print("\nRanked autocomplete:")
+    ranked = Trie()
+    for word, score in [("apple", 50), ("app", 90), ("application", 70),
+                        ("apply", 20), ("apricot", 40), ("banana", 99)]:
+        ranked.insert(word, score)
+    print(f"  top_k('ap', 3): {ranked.top_k('ap', 3)}")
+    print(f"  First 2 lazily: {list(islice(ranked.iter_words('ap'), 2))}")
+    
+    print("\nFuzzy search:")
+    print(f"  Within 1 of 'appel': {ranked.fuzzy_search('appel', 1)}")
+    print(f"  Within 1 of 'appel' (transpositions): "
+          f"{ranked.fuzzy_search('appel', 1, transpositions=True)}")
+    
+    print("\nFreezing:")
+    frozen = trie.freeze()
+    print(f"  {len(frozen)} words in {frozen.nbytes()} bytes")
+    print(f"  'apply': {frozen.search('apply')}")
+    print(f"  Starts with 'ban': {frozen.starts_with('ban')}")
+    print(f"  All words with prefix 'app': {frozen.get_all_words('app')}")
+    
+    print("\nBenchmark (Trie vs FrozenTrie):")
+    benchmark()
+    
+    print("\nBenchmark (building from many keys):")
+    benchmark_build()
+    
+    print("\nBenchmark (top_k vs sorting every completion):")
+    benchmark_top_k()
+    
+    print("\nBenchmark (fuzzy search vs linear scan):")
+    benchmark_fuzzy()
 